@@ -1,21 +1,71 @@
 """
 Vercel Serverless Function entry point for FastAPI backend.
 """
+import asyncio
+import logging
 import sys
 import os
-from pathlib import Path
 
 # Mark as Vercel environment FIRST before any other imports
-os.environ["VERCEL"] = "1"
+# setdefault keeps re-imports on warm invocations idempotent
+os.environ.setdefault("VERCEL", "1")
 
-# Add backend to Python path so imports work
-backend_path = Path(__file__).parent.parent / "backend"
-sys.path.insert(0, str(backend_path))
+# Use uvloop for the event loop Vercel creates to run the ASGI app
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
 
-# Import FastAPI app from backend
-# The create_app() function is used to avoid module-level side effects
-from app.main import create_app
+# Add backend to Python path so imports work. This must stay here: a .pth or
+# sitecustomize.py is only honoured from site-packages at interpreter startup,
+# and api/ is not a site directory in Vercel's runtime.
+backend_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend")
+if backend_path not in sys.path:
+    sys.path.insert(0, backend_path)
 
-# Create the app instance
-app = create_app()
+# FastAPI app instance, built on the first request rather than at import time.
+# Importing app.main pulls in SQLAlchemy, asyncpg, pydantic models and every
+# router, which would otherwise all be paid for before Vercel can start serving.
+_app = None
+
+# Background DB warm-up started alongside the app; the reference keeps the
+# task from being garbage collected before it finishes.
+_warmup_task = None
+_WARMUP_TIMEOUT_SECONDS = 5.0
+
+
+async def _warm_db():
+    """Open the first pooled connection without holding up any request.
+
+    Bounded by a short timeout so an unreachable database is reported in the
+    logs instead of waiting out asyncpg's connect timeout.
+    """
+    from app.core.database import warm_db_pool
+    try:
+        await asyncio.wait_for(warm_db_pool(), timeout=_WARMUP_TIMEOUT_SECONDS)
+    except Exception as e:
+        # Requests that need the DB will surface their own errors
+        logging.getLogger("app").warning(f"DB pool warm-up failed: {e!r}")
+
+
+async def app(scope, receive, send):
+    """ASGI entry point that lazily builds the FastAPI app.
+
+    Vercel's Python runtime serves ASGI apps natively, so no Lambda event
+    adapter (e.g. Mangum) is needed in front of it.
+    """
+    global _app, _warmup_task
+    if _app is None:
+        # The create_app() function is used to avoid module-level side effects
+        from app.main import create_app
+        _app = create_app()
+        # Pay the connection handshake once per cold start, in the background
+        # so the first request (often the /api/health probe) is not blocked;
+        # the pooled connection is then reused across warm invocations
+        _warmup_task = asyncio.create_task(_warm_db())
+    await _app(scope, receive, send)
+
+
+__all__ = ["app"]
 # Triggered redeploy 1769774227
@@ -1,9 +1,10 @@
 import asyncio
+import logging
 from logging.config import fileConfig
 import os
 import sys
 
-from sqlalchemy import pool
+from sqlalchemy import pool, text
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
@@ -12,10 +13,20 @@ from alembic import context
 # Add the backend directory to sys.path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# MIGRATION_MODE: "sync" runs migrations, "skip" does nothing. When unset it
+# defaults to "skip" on serverless (Vercel) instances, which never migrate -
+# run `alembic upgrade head` from CI before deploying instead - and to "sync"
+# everywhere else. An explicit MIGRATION_MODE always wins. Read before
+# load_dotenv so a VERCEL flag pulled into the root .env doesn't apply.
+migration_mode = os.getenv("MIGRATION_MODE", "").lower()
+if not migration_mode:
+    migration_mode = "skip" if os.getenv("VERCEL") else "sync"
+
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '.env'))
 
+from app.config import clean_database_url
 from app.core.database import Base
 from app.models import *  # noqa: Import all models
 
@@ -29,15 +40,7 @@ if database_url.startswith("postgresql://"):
     database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
 # Remove sslmode and channel_binding params which asyncpg doesn't support directly
 # asyncpg handles SSL differently - it will use SSL by default for cloud DBs
-if "?" in database_url:
-    base_url, params = database_url.split("?", 1)
-    # Filter out unsupported params
-    param_pairs = params.split("&")
-    supported_params = [p for p in param_pairs if not p.startswith("sslmode=") and not p.startswith("channel_binding=")]
-    if supported_params:
-        database_url = base_url + "?" + "&".join(supported_params)
-    else:
-        database_url = base_url
+database_url = clean_database_url(database_url)
 config.set_main_option("sqlalchemy.url", database_url)
 
 if config.config_file_name is not None:
@@ -45,6 +48,11 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Advisory lock key so concurrent deploys don't run migrations in parallel
+MIGRATION_LOCK_ID = 20250120
+
+logger = logging.getLogger("alembic.env")
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
@@ -54,6 +62,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -61,10 +70,25 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    # One transaction per migration, so a migration that builds indexes
+    # CONCURRENTLY (autocommit_block) only commits its own earlier steps
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        transaction_per_migration=True,
+    )
 
-    with context.begin_transaction():
-        context.run_migrations()
+    # Session-level advisory lock: a second instance blocks here until the
+    # first one finishes, then sees the schema already at head. Commit right
+    # away so Alembic still owns (and commits) the migration transaction.
+    connection.execute(text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+    connection.commit()
+    try:
+        with context.begin_transaction():
+            context.run_migrations()
+    finally:
+        connection.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID})
+        connection.commit()
 
 
 async def run_async_migrations() -> None:
@@ -73,6 +97,12 @@ async def run_async_migrations() -> None:
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        # Short DDL statements gain nothing from PG JIT compilation, and a
+        # one-shot migration connection never reuses prepared statements
+        connect_args={
+            "server_settings": {"jit": "off", "application_name": "alembic"},
+            "statement_cache_size": 0,
+        },
     )
 
     async with connectable.connect() as connection:
@@ -86,7 +116,12 @@ def run_migrations_online() -> None:
     asyncio.run(run_async_migrations())
 
 
-if context.is_offline_mode():
+if migration_mode == "skip":
+    logger.warning(
+        "MIGRATION_MODE=skip (default when VERCEL is set) - nothing was run; "
+        "set MIGRATION_MODE=sync to migrate"
+    )
+elif context.is_offline_mode():
     run_migrations_offline()
 else:
     run_migrations_online()
@@ -18,14 +18,23 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def upgrade() -> None:
-    # Enable UUID extension
-    op.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"')
+def _created_at() -> sa.Column:
+    return sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'))
+
+
+def _timestamps() -> list:
+    """created_at/updated_at pair shared by every mutable table."""
+    return [
+        _created_at(),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+    ]
+
 
+def upgrade() -> None:
     # Create influencers table
     op.create_table(
         'influencers',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('uuid_generate_v4()')),
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
         sa.Column('platform_type', sa.String(20), nullable=False, server_default='instagram'),
         sa.Column('username', sa.String(100), nullable=False),
         sa.Column('username_encrypted', sa.String(255), nullable=True),
@@ -50,8 +59,7 @@ def upgrade() -> None:
         sa.Column('primetag_raw_response', postgresql.JSONB, nullable=True),
         sa.Column('cached_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
         sa.Column('cache_expires_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+        *_timestamps(),
     )
 
     op.create_index('idx_influencers_platform_username', 'influencers', ['platform_type', 'username'], unique=True)
@@ -63,7 +71,7 @@ def upgrade() -> None:
     # Create searches table
     op.create_table(
         'searches',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('uuid_generate_v4()')),
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
         sa.Column('raw_query', sa.Text, nullable=False),
         sa.Column('parsed_query', postgresql.JSONB, nullable=True),
         sa.Column('target_count', sa.Integer, nullable=True),
@@ -81,8 +89,7 @@ def upgrade() -> None:
         sa.Column('saved_description', sa.Text, nullable=True),
         sa.Column('user_identifier', sa.String(255), nullable=True),
         sa.Column('executed_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+        *_timestamps(),
     )
 
     op.create_index('idx_searches_saved', 'searches', ['is_saved'])
@@ -92,7 +99,7 @@ def upgrade() -> None:
     # Create search_results table
     op.create_table(
         'search_results',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('uuid_generate_v4()')),
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
         sa.Column('search_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('searches.id', ondelete='CASCADE'), nullable=False),
         sa.Column('influencer_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('influencers.id', ondelete='CASCADE'), nullable=False),
         sa.Column('rank_position', sa.Integer, nullable=False),
@@ -103,7 +110,7 @@ def upgrade() -> None:
         sa.Column('growth_score_normalized', sa.Float, nullable=True),
         sa.Column('geography_score', sa.Float, nullable=True),
         sa.Column('metrics_snapshot', postgresql.JSONB, nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+        _created_at(),
     )
 
     op.create_index('idx_search_results_search', 'search_results', ['search_id'])
@@ -112,7 +119,7 @@ def upgrade() -> None:
     # Create api_audit_log table
     op.create_table(
         'api_audit_log',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('uuid_generate_v4()')),
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
         sa.Column('endpoint', sa.String(255), nullable=False),
         sa.Column('method', sa.String(10), nullable=False),
         sa.Column('request_params', postgresql.JSONB, nullable=True),
@@ -121,7 +128,7 @@ def upgrade() -> None:
         sa.Column('response_size_bytes', sa.Integer, nullable=True),
         sa.Column('error_message', sa.Text, nullable=True),
         sa.Column('search_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('searches.id', ondelete='SET NULL'), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+        _created_at(),
     )
 
     op.create_index('idx_api_audit_created', 'api_audit_log', ['created_at'])
@@ -130,7 +137,7 @@ def upgrade() -> None:
     # Create ranking_presets table
     op.create_table(
         'ranking_presets',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('uuid_generate_v4()')),
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
         sa.Column('name', sa.String(100), nullable=False, unique=True),
         sa.Column('description', sa.Text, nullable=True),
         sa.Column('credibility_weight', sa.Float, server_default='0.25'),
@@ -140,8 +147,7 @@ def upgrade() -> None:
         sa.Column('geography_weight', sa.Float, server_default='0.10'),
         sa.Column('is_default', sa.Boolean, server_default='false'),
         sa.Column('is_system', sa.Boolean, server_default='false'),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+        *_timestamps(),
     )
 
     # Insert default presets
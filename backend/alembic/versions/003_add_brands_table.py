@@ -22,7 +22,7 @@ def upgrade() -> None:
     # Create brands table for Spanish brand knowledge base
     op.create_table(
         'brands',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('uuid_generate_v4()')),
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
         sa.Column('name', sa.String(255), nullable=False),
         sa.Column('name_normalized', sa.String(255), nullable=False),  # lowercase, no accents for deduplication
         sa.Column('description', sa.Text, nullable=True),
@@ -78,69 +78,34 @@ def upgrade() -> None:
     # Update default presets with balanced weights across 8 factors
     # New distribution: credibility=0.15, engagement=0.20, audience=0.15, growth=0.10, 
     #                   geography=0.10, brand_affinity=0.10, creative_fit=0.10, niche_match=0.10
+    # One UPDATE with per-preset CASE values instead of a statement per preset
     op.execute("""
         UPDATE ranking_presets SET
-            credibility_weight = 0.15,
-            engagement_weight = 0.20,
-            audience_match_weight = 0.15,
-            growth_weight = 0.10,
-            geography_weight = 0.10,
-            brand_affinity_weight = 0.10,
-            creative_fit_weight = 0.10,
-            niche_match_weight = 0.10
-        WHERE name = 'Balanced'
-    """)
-
-    op.execute("""
-        UPDATE ranking_presets SET
-            credibility_weight = 0.10,
-            engagement_weight = 0.40,
-            audience_match_weight = 0.15,
-            growth_weight = 0.10,
-            geography_weight = 0.05,
-            brand_affinity_weight = 0.05,
-            creative_fit_weight = 0.10,
-            niche_match_weight = 0.05
-        WHERE name = 'Engagement Focus'
-    """)
-
-    op.execute("""
-        UPDATE ranking_presets SET
-            credibility_weight = 0.30,
-            engagement_weight = 0.15,
-            audience_match_weight = 0.20,
-            growth_weight = 0.05,
-            geography_weight = 0.05,
-            brand_affinity_weight = 0.10,
-            creative_fit_weight = 0.05,
-            niche_match_weight = 0.10
-        WHERE name = 'Quality First'
-    """)
-
-    op.execute("""
-        UPDATE ranking_presets SET
-            credibility_weight = 0.10,
-            engagement_weight = 0.15,
-            audience_match_weight = 0.15,
-            growth_weight = 0.30,
-            geography_weight = 0.05,
-            brand_affinity_weight = 0.05,
-            creative_fit_weight = 0.10,
-            niche_match_weight = 0.10
-        WHERE name = 'Growth Oriented'
-    """)
-
-    op.execute("""
-        UPDATE ranking_presets SET
-            credibility_weight = 0.15,
-            engagement_weight = 0.15,
-            audience_match_weight = 0.15,
-            growth_weight = 0.05,
-            geography_weight = 0.25,
-            brand_affinity_weight = 0.10,
-            creative_fit_weight = 0.05,
-            niche_match_weight = 0.10
-        WHERE name = 'Local Reach'
+            credibility_weight = CASE name
+                WHEN 'Balanced' THEN 0.15 WHEN 'Engagement Focus' THEN 0.10 WHEN 'Quality First' THEN 0.30
+                WHEN 'Growth Oriented' THEN 0.10 WHEN 'Local Reach' THEN 0.15 END,
+            engagement_weight = CASE name
+                WHEN 'Balanced' THEN 0.20 WHEN 'Engagement Focus' THEN 0.40 WHEN 'Quality First' THEN 0.15
+                WHEN 'Growth Oriented' THEN 0.15 WHEN 'Local Reach' THEN 0.15 END,
+            audience_match_weight = CASE name
+                WHEN 'Balanced' THEN 0.15 WHEN 'Engagement Focus' THEN 0.15 WHEN 'Quality First' THEN 0.20
+                WHEN 'Growth Oriented' THEN 0.15 WHEN 'Local Reach' THEN 0.15 END,
+            growth_weight = CASE name
+                WHEN 'Balanced' THEN 0.10 WHEN 'Engagement Focus' THEN 0.10 WHEN 'Quality First' THEN 0.05
+                WHEN 'Growth Oriented' THEN 0.30 WHEN 'Local Reach' THEN 0.05 END,
+            geography_weight = CASE name
+                WHEN 'Balanced' THEN 0.10 WHEN 'Engagement Focus' THEN 0.05 WHEN 'Quality First' THEN 0.05
+                WHEN 'Growth Oriented' THEN 0.05 WHEN 'Local Reach' THEN 0.25 END,
+            brand_affinity_weight = CASE name
+                WHEN 'Balanced' THEN 0.10 WHEN 'Engagement Focus' THEN 0.05 WHEN 'Quality First' THEN 0.10
+                WHEN 'Growth Oriented' THEN 0.05 WHEN 'Local Reach' THEN 0.10 END,
+            creative_fit_weight = CASE name
+                WHEN 'Balanced' THEN 0.10 WHEN 'Engagement Focus' THEN 0.10 WHEN 'Quality First' THEN 0.05
+                WHEN 'Growth Oriented' THEN 0.10 WHEN 'Local Reach' THEN 0.05 END,
+            niche_match_weight = CASE name
+                WHEN 'Balanced' THEN 0.10 WHEN 'Engagement Focus' THEN 0.05 WHEN 'Quality First' THEN 0.10
+                WHEN 'Growth Oriented' THEN 0.10 WHEN 'Local Reach' THEN 0.10 END
+        WHERE name IN ('Balanced', 'Engagement Focus', 'Quality First', 'Growth Oriented', 'Local Reach')
     """)
 
     # Add new preset focused on brand partnerships
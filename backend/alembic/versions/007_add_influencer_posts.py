@@ -23,7 +23,7 @@ def upgrade() -> None:
     # Create influencer_posts table
     op.create_table(
         'influencer_posts',
-        sa.Column('id', UUID(as_uuid=True), primary_key=True, server_default=sa.text('uuid_generate_v4()')),
+        sa.Column('id', UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
         sa.Column('influencer_id', UUID(as_uuid=True), sa.ForeignKey('influencers.id', ondelete='CASCADE'), nullable=False),
 
         # Post identifiers
@@ -68,8 +68,14 @@ def upgrade() -> None:
     # Create indexes for efficient querying
     op.create_index('idx_posts_influencer', 'influencer_posts', ['influencer_id'])
     op.create_index('idx_posts_posted_at', 'influencer_posts', ['posted_at'])
-    op.create_index('idx_posts_hashtags', 'influencer_posts', ['hashtags'], postgresql_using='gin')
-    op.create_index('idx_posts_mentions', 'influencer_posts', ['mentions'], postgresql_using='gin')
+
+    # GIN builds are slow on a populated table; build them CONCURRENTLY
+    # (outside the migration transaction) so writes aren't blocked meanwhile
+    with op.get_context().autocommit_block():
+        op.create_index('idx_posts_hashtags', 'influencer_posts', ['hashtags'], postgresql_using='gin',
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_posts_mentions', 'influencer_posts', ['mentions'], postgresql_using='gin',
+                        postgresql_concurrently=True, if_not_exists=True)
 
     # Add post_content_aggregated column to influencers table
     # This stores pre-computed niche signals for fast queries
@@ -13,8 +13,6 @@ These columns enable fast filtering and matching based on:
 - Sponsored content ratio
 """
 from alembic import op
-import sqlalchemy as sa
-from sqlalchemy.dialects.postgresql import JSONB
 
 
 # revision identifiers, used by Alembic.
@@ -24,45 +22,45 @@ branch_labels = None
 depends_on = None
 
 
+COLUMN_COMMENTS = {
+    'primary_niche': 'Inferred primary content niche (e.g., padel, football, fitness)',
+    'niche_confidence': 'Confidence score for niche detection (0.0-1.0)',
+    'detected_brands': 'Brands detected from post mentions/hashtags',
+    'sponsored_ratio': 'Ratio of sponsored posts (0.0-1.0)',
+    'content_language': 'Primary content language (es, en, ca, etc.)',
+    'content_themes': 'Detected content themes for creative matching',
+}
+
+
 def upgrade() -> None:
-    # Add niche detection columns
-    op.add_column(
-        'influencers',
-        sa.Column('primary_niche', sa.String(50), nullable=True,
-                  comment='Inferred primary content niche (e.g., padel, football, fitness)')
-    )
-    op.add_column(
-        'influencers',
-        sa.Column('niche_confidence', sa.Float(), nullable=True,
-                  comment='Confidence score for niche detection (0.0-1.0)')
-    )
-    op.add_column(
-        'influencers',
-        sa.Column('detected_brands', JSONB(), nullable=True,
-                  comment='Brands detected from post mentions/hashtags')
-    )
-    op.add_column(
-        'influencers',
-        sa.Column('sponsored_ratio', sa.Float(), nullable=True,
-                  comment='Ratio of sponsored posts (0.0-1.0)')
-    )
-    op.add_column(
-        'influencers',
-        sa.Column('content_language', sa.String(10), nullable=True,
-                  comment='Primary content language (es, en, ca, etc.)')
-    )
-    op.add_column(
-        'influencers',
-        sa.Column('content_themes', JSONB(), nullable=True,
-                  comment='Detected content themes for creative matching')
+    # Add niche detection columns in a single ALTER TABLE so the exclusive
+    # lock on influencers is taken once; every column is nullable without a
+    # default, so this is a catalog-only change
+    op.execute(
+        "ALTER TABLE influencers "
+        "ADD COLUMN primary_niche VARCHAR(50), "
+        "ADD COLUMN niche_confidence DOUBLE PRECISION, "
+        "ADD COLUMN detected_brands JSONB, "
+        "ADD COLUMN sponsored_ratio DOUBLE PRECISION, "
+        "ADD COLUMN content_language VARCHAR(10), "
+        "ADD COLUMN content_themes JSONB"
     )
+    for column, comment in COLUMN_COMMENTS.items():
+        op.execute(f"COMMENT ON COLUMN influencers.{column} IS '{comment}'")
 
     # Create indexes for efficient querying
     op.create_index('idx_influencers_primary_niche', 'influencers', ['primary_niche'])
     op.create_index('idx_influencers_niche_confidence', 'influencers', ['niche_confidence'])
-    op.create_index('idx_influencers_detected_brands', 'influencers', ['detected_brands'], postgresql_using='gin')
     op.create_index('idx_influencers_content_language', 'influencers', ['content_language'])
-    op.create_index('idx_influencers_content_themes', 'influencers', ['content_themes'], postgresql_using='gin')
+
+    # GIN builds over the whole influencers table are slow; build them
+    # CONCURRENTLY (outside the migration transaction) so the API can keep
+    # reading and writing influencers meanwhile
+    with op.get_context().autocommit_block():
+        op.create_index('idx_influencers_detected_brands', 'influencers', ['detected_brands'], postgresql_using='gin',
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_influencers_content_themes', 'influencers', ['content_themes'], postgresql_using='gin',
+                        postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
@@ -74,9 +72,7 @@ def downgrade() -> None:
     op.drop_index('idx_influencers_primary_niche', table_name='influencers')
 
     # Drop columns
-    op.drop_column('influencers', 'content_themes')
-    op.drop_column('influencers', 'content_language')
-    op.drop_column('influencers', 'sponsored_ratio')
-    op.drop_column('influencers', 'detected_brands')
-    op.drop_column('influencers', 'niche_confidence')
-    op.drop_column('influencers', 'primary_niche')
+    op.execute(
+        "ALTER TABLE influencers "
+        + ", ".join(f"DROP COLUMN {column}" for column in reversed(COLUMN_COMMENTS))
+    )
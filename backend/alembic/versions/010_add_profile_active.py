@@ -9,6 +9,12 @@ whose Instagram handles no longer resolve (renamed, deleted, or scraped incorrec
 
 - True  (default): handle assumed active, included in search results
 - False: handle confirmed gone; excluded from all discovery queries
+
+Adding a NOT NULL column with a constant server_default is metadata-only on
+PostgreSQL 11+ (Neon runs 15+): existing rows read the default from the
+catalog, so there is no table rewrite or backfill to batch. The ALTER still
+needs a brief ACCESS EXCLUSIVE lock, so lock_timeout makes it fail fast
+instead of queueing every influencers query behind a long-running one.
 """
 
 from alembic import op
@@ -22,6 +28,7 @@ depends_on = None
 
 
 def upgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '5s'")
     op.add_column(
         "influencers",
         sa.Column(
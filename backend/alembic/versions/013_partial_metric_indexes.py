@@ -0,0 +1,67 @@
+"""Replace single-column metric indexes with partial, covering DESC indexes
+
+Revision ID: 013_partial_metric_indexes
+Revises: 012_add_idea_match_tables
+Create Date: 2026-10-16
+
+The plain b-tree indexes from 001 on credibility_score, engagement_rate,
+follower_growth_rate_6m and cache_expires_at index every NULL row, and
+top-K ranking queries still hit the heap for username/follower_count.
+
+The replacements:
+- skip NULL rows (imported profiles without PrimeTag metrics)
+- are ordered DESC NULLS LAST to match `ORDER BY <metric> DESC`
+- INCLUDE the columns shown next to the metric so top-K scans are index-only
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "013_partial_metric_indexes"
+down_revision = "012_add_idea_match_tables"
+branch_labels = None
+depends_on = None
+
+
+# index name -> (column, INCLUDE columns)
+METRIC_INDEXES = {
+    "idx_influencers_credibility": (
+        "credibility_score", ["username", "follower_count", "engagement_rate"]
+    ),
+    "idx_influencers_engagement": (
+        "engagement_rate", ["username", "follower_count", "credibility_score"]
+    ),
+    "idx_influencers_growth": (
+        "follower_growth_rate_6m", ["username", "follower_count", "engagement_rate"]
+    ),
+}
+
+
+def upgrade() -> None:
+    for name, (column, include) in METRIC_INDEXES.items():
+        op.drop_index(name, table_name="influencers")
+        op.create_index(
+            name,
+            "influencers",
+            [sa.text(f"{column} DESC NULLS LAST")],
+            postgresql_where=sa.text(f"{column} IS NOT NULL"),
+            postgresql_include=include,
+        )
+
+    op.drop_index("idx_influencers_cache_expiry", table_name="influencers")
+    op.create_index(
+        "idx_influencers_cache_expiry",
+        "influencers",
+        ["cache_expires_at"],
+        postgresql_where=sa.text("cache_expires_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_influencers_cache_expiry", table_name="influencers")
+    op.create_index("idx_influencers_cache_expiry", "influencers", ["cache_expires_at"])
+
+    for name, (column, _) in METRIC_INDEXES.items():
+        op.drop_index(name, table_name="influencers")
+        op.create_index(name, "influencers", [column])
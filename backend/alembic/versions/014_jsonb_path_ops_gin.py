@@ -0,0 +1,49 @@
+"""Rebuild interests/brand_mentions/extra_data GIN indexes with jsonb_path_ops
+
+Revision ID: 014_jsonb_path_ops_gin
+Revises: 013_partial_metric_indexes
+Create Date: 2026-10-16
+
+The GIN indexes from 002, 003 and 004 use the default jsonb_ops opclass,
+which indexes every key and value separately. Lookups on these columns are
+containment checks (`interests @> '["Fitness"]'`), which jsonb_path_ops
+serves with one hash per path - a noticeably smaller index with fewer
+pages read per lookup.
+
+Note: jsonb_path_ops does not support the key-existence operators
+(?, ?|, ?&); use @> for these columns.
+"""
+
+from alembic import op
+
+
+revision = "014_jsonb_path_ops_gin"
+down_revision = "013_partial_metric_indexes"
+branch_labels = None
+depends_on = None
+
+
+# index name -> (table, column)
+GIN_INDEXES = {
+    "idx_influencers_interests": ("influencers", "interests"),
+    "idx_influencers_brand_mentions": ("influencers", "brand_mentions"),
+    "idx_brands_extra_data": ("brands", "extra_data"),
+}
+
+
+def upgrade() -> None:
+    for name, (table, column) in GIN_INDEXES.items():
+        op.drop_index(name, table_name=table)
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "jsonb_path_ops"},
+        )
+
+
+def downgrade() -> None:
+    for name, (table, column) in GIN_INDEXES.items():
+        op.drop_index(name, table_name=table)
+        op.create_index(name, table, [column], postgresql_using="gin")
@@ -0,0 +1,33 @@
+"""Add composite (platform_type, follower_count DESC) index
+
+Revision ID: 015_platform_followers_index
+Revises: 014_jsonb_path_ops_gin
+Create Date: 2026-10-16
+
+Serves the common "biggest accounts on a platform first" access path
+(`WHERE platform_type = 'instagram' ORDER BY follower_count DESC LIMIT K`)
+straight from the index, without a heap scan + sort. Rows without a
+follower_count are never returned first, so they are left out.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "015_platform_followers_index"
+down_revision = "014_jsonb_path_ops_gin"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_influencers_platform_followers",
+        "influencers",
+        ["platform_type", sa.text("follower_count DESC NULLS LAST")],
+        postgresql_where=sa.text("follower_count IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_influencers_platform_followers", table_name="influencers")
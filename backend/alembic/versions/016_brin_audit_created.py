@@ -0,0 +1,37 @@
+"""Use a BRIN index for api_audit_log.created_at
+
+Revision ID: 016_brin_audit_created
+Revises: 015_platform_followers_index
+Create Date: 2026-10-16
+
+api_audit_log is append-only, so created_at follows physical row order and
+a BRIN summary per 32-page range answers time-window queries with an index
+orders of magnitude smaller than the b-tree from 001.
+
+searches.executed_at keeps its b-tree: search history is read with
+ORDER BY executed_at DESC LIMIT n, which BRIN cannot serve.
+"""
+
+from alembic import op
+
+
+revision = "016_brin_audit_created"
+down_revision = "015_platform_followers_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_api_audit_created", table_name="api_audit_log")
+    op.create_index(
+        "idx_api_audit_created",
+        "api_audit_log",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_api_audit_created", table_name="api_audit_log")
+    op.create_index("idx_api_audit_created", "api_audit_log", ["created_at"])
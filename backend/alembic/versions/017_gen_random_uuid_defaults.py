@@ -0,0 +1,45 @@
+"""Switch UUID primary key defaults from uuid_generate_v4() to gen_random_uuid()
+
+Revision ID: 017_gen_random_uuid_defaults
+Revises: 016_brin_audit_created
+Create Date: 2026-10-16
+
+gen_random_uuid() is built into PostgreSQL 13+ (Neon runs 15+), so the
+uuid-ossp extension enabled in 001 is no longer needed once every table
+default points at the core function. The tables added in 012 already use it,
+and 001/003/007 now create their tables with it too, so on a fresh install
+this revision only drops an extension that was never created.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "017_gen_random_uuid_defaults"
+down_revision = "016_brin_audit_created"
+branch_labels = None
+depends_on = None
+
+
+# Tables whose id column defaulted to uuid_generate_v4()
+UUID_TABLES = [
+    "influencers",
+    "searches",
+    "search_results",
+    "api_audit_log",
+    "ranking_presets",
+    "brands",
+    "influencer_posts",
+]
+
+
+def upgrade() -> None:
+    for table in UUID_TABLES:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+    op.execute('DROP EXTENSION IF EXISTS "uuid-ossp"')
+
+
+def downgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"')
+    for table in UUID_TABLES:
+        op.alter_column(table, "id", server_default=sa.text("uuid_generate_v4()"))
@@ -0,0 +1,31 @@
+"""Record (search_id, rank_position) as the clustering key for search_results
+
+Revision ID: 018_cluster_search_results
+Revises: 017_gen_random_uuid_defaults
+Create Date: 2026-10-16
+
+Every read of search_results is `WHERE search_id = ? ORDER BY rank_position`.
+Marking idx_search_results_rank as the cluster index lets a periodic
+CLUSTER (or pg_repack) lay each search's rows out contiguously, so a
+result fetch reads a few adjacent heap pages instead of one page per row.
+
+ALTER TABLE ... CLUSTER ON only records the key - it does not rewrite the
+table. Run the maintenance job to physically reorder:
+    cd backend && python -m app.services.cluster_tables
+"""
+
+from alembic import op
+
+
+revision = "018_cluster_search_results"
+down_revision = "017_gen_random_uuid_defaults"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE search_results CLUSTER ON idx_search_results_rank")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE search_results SET WITHOUT CLUSTER")
@@ -0,0 +1,85 @@
+"""Collapse ranking_presets weight columns into a single weights JSONB
+
+Revision ID: 019_ranking_preset_weights_jsonb
+Revises: 018_cluster_search_results
+Create Date: 2026-10-16
+
+Every new ranking factor used to need a column, a CHECK constraint rewrite
+and one UPDATE per preset (see 004). Presets now store their weights as a
+JSONB object keyed like RankingWeights / searches.ranking_weights:
+    {"credibility": 0.15, "engagement": 0.20, ..., "niche_match": 0.10}
+
+The sum-to-1 rule moves from the CHECK constraint to a trigger. The trigger
+only checks the sum, so adding a factor needs no migration at all; which keys
+are allowed is checked in Python against RankingWeights (RankingPreset's
+weights validator).
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+revision = "019_ranking_preset_weights_jsonb"
+down_revision = "018_cluster_search_results"
+branch_labels = None
+depends_on = None
+
+
+# JSONB key -> (legacy column, legacy server_default from 001/004)
+FACTORS = {
+    "credibility": ("credibility_weight", "0.25"),
+    "engagement": ("engagement_weight", "0.30"),
+    "audience_match": ("audience_match_weight", "0.25"),
+    "growth": ("growth_weight", "0.10"),
+    "geography": ("geography_weight", "0.10"),
+    "brand_affinity": ("brand_affinity_weight", "0.0"),
+    "creative_fit": ("creative_fit_weight", "0.0"),
+    "niche_match": ("niche_match_weight", "0.0"),
+}
+
+WEIGHTS_SUM_CHECK = " + ".join(column for column, _ in FACTORS.values()) + " BETWEEN 0.99 AND 1.01"
+
+
+def upgrade() -> None:
+    op.add_column("ranking_presets", sa.Column("weights", JSONB, nullable=True))
+
+    pairs = ", ".join(f"'{key}', COALESCE({column}, 0)" for key, (column, _) in FACTORS.items())
+    op.execute(f"UPDATE ranking_presets SET weights = jsonb_build_object({pairs})")
+    op.alter_column("ranking_presets", "weights", nullable=False)
+
+    op.drop_constraint("weights_sum_check", "ranking_presets", type_="check")
+    op.execute("""
+        CREATE OR REPLACE FUNCTION check_ranking_weights_sum() RETURNS trigger AS $$
+        DECLARE
+            total double precision;
+        BEGIN
+            SELECT COALESCE(SUM(value::double precision), 0) INTO total
+            FROM jsonb_each_text(NEW.weights);
+            IF total NOT BETWEEN 0.99 AND 1.01 THEN
+                RAISE EXCEPTION 'ranking preset weights must sum to 1.0 (got %)', total
+                    USING ERRCODE = 'check_violation';
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER ranking_presets_weights_sum
+        BEFORE INSERT OR UPDATE OF weights ON ranking_presets
+        FOR EACH ROW EXECUTE FUNCTION check_ranking_weights_sum()
+    """)
+
+    for column, _ in FACTORS.values():
+        op.drop_column("ranking_presets", column)
+
+
+def downgrade() -> None:
+    for key, (column, default) in FACTORS.items():
+        op.add_column("ranking_presets", sa.Column(column, sa.Float, server_default=default))
+        op.execute(f"UPDATE ranking_presets SET {column} = COALESCE((weights->>'{key}')::float, 0)")
+
+    op.execute("DROP TRIGGER IF EXISTS ranking_presets_weights_sum ON ranking_presets")
+    op.execute("DROP FUNCTION IF EXISTS check_ranking_weights_sum()")
+    op.create_check_constraint("weights_sum_check", "ranking_presets", WEIGHTS_SUM_CHECK)
+    op.drop_column("ranking_presets", "weights")
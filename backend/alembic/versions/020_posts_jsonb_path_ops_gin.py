@@ -0,0 +1,64 @@
+"""Rebuild hashtags/mentions/detected_brands/content_themes GIN indexes with jsonb_path_ops
+
+Revision ID: 020_posts_jsonb_path_ops_gin
+Revises: 019_ranking_preset_weights_jsonb
+Create Date: 2026-10-16
+
+Same change as 014, for the GIN indexes added in 007 and 008. No query in
+the app filters these columns in SQL today (hashtags, mentions and brands
+are matched in Python after the fetch), so the indexes cost more than they
+return: every post import and niche enrichment rewrites their entries.
+jsonb_path_ops stores one hash per path/value instead of an entry per key
+and per value, so the indexes are much smaller and cheaper to maintain,
+while still serving `@>` containment if a query ever needs it.
+
+Each index is rebuilt CONCURRENTLY under a temporary name and then swapped
+in, so the old index keeps serving lookups until the new one is ready and
+writes to influencers/influencer_posts are never blocked.
+
+Note: jsonb_path_ops does not support the key-existence operators
+(?, ?|, ?&); use @> for these columns.
+"""
+
+from typing import Optional
+
+from alembic import op
+
+
+revision = "020_posts_jsonb_path_ops_gin"
+down_revision = "019_ranking_preset_weights_jsonb"
+branch_labels = None
+depends_on = None
+
+
+# index name -> (table, column)
+GIN_INDEXES = {
+    "idx_posts_hashtags": ("influencer_posts", "hashtags"),
+    "idx_posts_mentions": ("influencer_posts", "mentions"),
+    "idx_influencers_detected_brands": ("influencers", "detected_brands"),
+    "idx_influencers_content_themes": ("influencers", "content_themes"),
+}
+
+
+def _rebuild(opclass: Optional[str]) -> None:
+    with op.get_context().autocommit_block():
+        for name, (table, column) in GIN_INDEXES.items():
+            tmp_name = f"{name}_new"
+            op.create_index(
+                tmp_name,
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: opclass} if opclass else {},
+                postgresql_concurrently=True,
+            )
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+            op.execute(f"ALTER INDEX {tmp_name} RENAME TO {name}")
+
+
+def upgrade() -> None:
+    _rebuild("jsonb_path_ops")
+
+
+def downgrade() -> None:
+    _rebuild(None)
@@ -0,0 +1,63 @@
+"""Add mv_influencer_facets materialized view for discovery rollups
+
+Revision ID: 021_influencer_facets_mv
+Revises: 020_posts_jsonb_path_ops_gin
+Create Date: 2026-10-16
+
+Counts and median follower_count of active influencers for every
+combination of primary_niche, influencer_tier, influencer_gender and
+content_language (GROUP BY CUBE), so niche/tier/gender breakdowns are a
+lookup on a few hundred rows instead of a scan of influencers.
+
+Dimension values:
+  - '*'        the dimension is rolled up (all values)
+  - 'unknown'  the influencer has no value for it (column is NULL)
+Keeping both non-NULL lets the unique index back
+REFRESH MATERIALIZED VIEW CONCURRENTLY.
+
+Refreshed out-of-band after imports/enrichment:
+    cd backend && python -m app.services.refresh_facets
+"""
+
+from alembic import op
+
+
+revision = "021_influencer_facets_mv"
+down_revision = "020_posts_jsonb_path_ops_gin"
+branch_labels = None
+depends_on = None
+
+
+DIMENSIONS = ["primary_niche", "influencer_tier", "influencer_gender", "content_language"]
+
+
+def upgrade() -> None:
+    inner = ",\n                ".join(f"COALESCE({d}, 'unknown') AS {d}" for d in DIMENSIONS)
+    outer = ",\n            ".join(
+        f"CASE WHEN GROUPING({d}) = 1 THEN '*' ELSE {d} END AS {d}" for d in DIMENSIONS
+    )
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW mv_influencer_facets AS
+        SELECT
+            {outer},
+            count(*) AS influencer_count,
+            percentile_cont(0.5) WITHIN GROUP (ORDER BY follower_count) AS median_followers
+        FROM (
+            SELECT
+                {inner},
+                follower_count
+            FROM influencers
+            WHERE profile_active
+        ) AS active
+        GROUP BY CUBE ({", ".join(DIMENSIONS)})
+    """)
+    op.create_index(
+        "idx_mv_influencer_facets_key",
+        "mv_influencer_facets",
+        DIMENSIONS,
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_influencer_facets")
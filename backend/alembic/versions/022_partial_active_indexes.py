@@ -0,0 +1,71 @@
+"""Replace profile_active/tier/gender/niche indexes with partial indexes on active profiles
+
+Revision ID: 022_partial_active_indexes
+Revises: 021_influencer_facets_mv
+Create Date: 2026-10-16
+
+Every discovery query filters `profile_active = true`, so:
+  - idx_influencers_profile_active (010) is one huge equality bucket the
+    planner never picks, and
+  - the tier (009), gender (011) and niche (008) indexes also index
+    deactivated profiles that no query can return.
+
+They are replaced by partial indexes `WHERE profile_active`. The niche index
+is built on lower(primary_niche), the expression the niche discovery query
+(cache_service.find_by_niche) actually compares against.
+
+Note: the partial indexes are only usable by queries that filter
+`profile_active = true` (not `IS NOT false`).
+
+Built/dropped CONCURRENTLY so influencers stays writable.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "022_partial_active_indexes"
+down_revision = "021_influencer_facets_mv"
+branch_labels = None
+depends_on = None
+
+
+# new partial index -> indexed expression
+PARTIAL_INDEXES = {
+    "idx_infl_tier_active": "influencer_tier",
+    "idx_infl_gender_active": "influencer_gender",
+    "idx_infl_niche_active": "lower(primary_niche)",
+}
+
+# full-table index being replaced -> column
+REPLACED_INDEXES = {
+    "idx_influencers_profile_active": "profile_active",
+    "idx_influencers_tier": "influencer_tier",
+    "idx_influencers_influencer_gender": "influencer_gender",
+    "idx_influencers_primary_niche": "primary_niche",
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, expression in PARTIAL_INDEXES.items():
+            op.create_index(
+                name,
+                "influencers",
+                [sa.text(expression)],
+                postgresql_where=sa.text("profile_active"),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name in REPLACED_INDEXES:
+            op.drop_index(name, table_name="influencers", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, column in REPLACED_INDEXES.items():
+            op.create_index(
+                name, "influencers", [column], postgresql_concurrently=True, if_not_exists=True
+            )
+        for name in PARTIAL_INDEXES:
+            op.drop_index(name, table_name="influencers", postgresql_concurrently=True, if_exists=True)
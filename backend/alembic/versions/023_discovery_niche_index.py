@@ -0,0 +1,60 @@
+"""Composite index for the niche discovery query
+
+Revision ID: 023_discovery_niche_index
+Revises: 022_partial_active_indexes
+Create Date: 2026-10-16
+
+The canonical discovery query (cache_service.find_by_niche) is:
+
+    SELECT influencers.* FROM influencers
+    WHERE lower(primary_niche) IN (...) AND profile_active = true AND ...
+    ORDER BY niche_confidence DESC NULLS LAST LIMIT n
+
+idx_infl_niche_active (022) finds the niche rows but leaves the sort to a
+separate step over every match. Adding niche_confidence as a second key
+returns each niche's rows already in ranking order, and the index replaces
+022's niche index since it has the same leading expression.
+
+The query selects whole rows for ranking, so this is not a covering
+(INCLUDE) index - an index-only scan isn't possible here.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "023_discovery_niche_index"
+down_revision = "022_partial_active_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_infl_discovery",
+            "influencers",
+            [sa.text("lower(primary_niche)"), sa.text("niche_confidence DESC NULLS LAST")],
+            postgresql_where=sa.text("profile_active"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_infl_niche_active", table_name="influencers", postgresql_concurrently=True, if_exists=True
+        )
+        op.execute("VACUUM (ANALYZE) influencers")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_infl_niche_active",
+            "influencers",
+            [sa.text("lower(primary_niche)")],
+            postgresql_where=sa.text("profile_active"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_infl_discovery", table_name="influencers", postgresql_concurrently=True, if_exists=True
+        )
@@ -0,0 +1,52 @@
+"""Replace idx_posts_influencer with (influencer_id, posted_at DESC)
+
+Revision ID: 025_posts_influencer_time_index
+Revises: 023_discovery_niche_index
+Create Date: 2026-10-16
+
+Post reads are always per influencer (the Influencer.posts relationship,
+ON DELETE CASCADE from influencers, and "latest posts" for niche
+detection). One composite index serves the FK lookup and returns an
+influencer's posts newest-first without a sort, so the single-column FK
+index from 007 is dropped.
+
+No INCLUDE columns: caption is unbounded text, and a b-tree entry over
+~2.7kB makes the INSERT fail.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "025_posts_influencer_time_index"
+down_revision = "023_discovery_niche_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_posts_infl_time",
+            "influencer_posts",
+            ["influencer_id", sa.text("posted_at DESC NULLS LAST")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_posts_influencer", table_name="influencer_posts", postgresql_concurrently=True, if_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_posts_influencer",
+            "influencer_posts",
+            ["influencer_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_posts_infl_time", table_name="influencer_posts", postgresql_concurrently=True, if_exists=True
+        )
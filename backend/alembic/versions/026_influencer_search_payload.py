@@ -0,0 +1,96 @@
+"""Consolidate detected_brands/content_themes GIN indexes into one search_payload index
+
+Revision ID: 026_influencer_search_payload
+Revises: 025_posts_influencer_time_index
+Create Date: 2026-10-16
+
+Every write to an influencer's niche data (Apify enrichment, LLM niche
+enrichment) updated two GIN indexes, one per JSONB column. They are
+replaced by a single stored generated column
+
+    search_payload = {"brands": detected_brands, "themes": content_themes,
+                      "niche": primary_niche, "lang": content_language}
+
+with one jsonb_path_ops GIN over active profiles, so one index answers any
+combination of those filters:
+
+    WHERE search_payload @> '{"brands": ["nike"], "niche": "padel"}'
+
+jsonb_build_object() is only STABLE (it can format arbitrary types), so the
+generation expression goes through an IMMUTABLE wrapper - safe here since
+every argument is text/jsonb.
+
+Adding a stored generated column rewrites influencers once (ACCESS
+EXCLUSIVE for the duration); the table holds a few thousand profiles.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+revision = "026_influencer_search_payload"
+down_revision = "025_posts_influencer_time_index"
+branch_labels = None
+depends_on = None
+
+
+# index name -> column (from 008, rebuilt with jsonb_path_ops in 020)
+REPLACED_INDEXES = {
+    "idx_influencers_detected_brands": "detected_brands",
+    "idx_influencers_content_themes": "content_themes",
+}
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION influencer_search_payload(
+            brands jsonb, themes jsonb, niche text, lang text
+        ) RETURNS jsonb
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT jsonb_build_object('brands', brands, 'themes', themes, 'niche', niche, 'lang', lang)
+        $$
+    """)
+    op.add_column(
+        "influencers",
+        sa.Column(
+            "search_payload",
+            JSONB,
+            sa.Computed(
+                "influencer_search_payload(detected_brands, content_themes, primary_niche, content_language)",
+                persisted=True,
+            ),
+        ),
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_infl_payload",
+            "influencers",
+            ["search_payload"],
+            postgresql_using="gin",
+            postgresql_ops={"search_payload": "jsonb_path_ops"},
+            postgresql_where=sa.text("profile_active"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name in REPLACED_INDEXES:
+            op.drop_index(name, table_name="influencers", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, column in REPLACED_INDEXES.items():
+            op.create_index(
+                name,
+                "influencers",
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "jsonb_path_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+    op.drop_index("idx_infl_payload", table_name="influencers")
+    op.drop_column("influencers", "search_payload")
+    op.execute("DROP FUNCTION IF EXISTS influencer_search_payload(jsonb, jsonb, text, text)")
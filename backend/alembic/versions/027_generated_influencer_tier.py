@@ -0,0 +1,112 @@
+"""Make influencers.influencer_tier a generated column
+
+Revision ID: 027_generated_influencer_tier
+Revises: 026_influencer_search_payload
+Create Date: 2026-10-16
+
+influencer_tier (009) was a plain column filled in by a separate
+compute_tiers.py run, so it went stale whenever follower_count changed
+until the next backfill. It is now GENERATED ALWAYS ... STORED from
+follower_count, with the same buckets:
+  micro  — < 50K followers
+  mid    — 50K–500K followers
+  macro  — 500K–2M followers
+  mega   — >= 2M followers
+  NULL   — no follower_count
+
+Postgres can't turn an existing column into a generated one, so the column
+is dropped and re-added in one ALTER TABLE (this rewrites influencers).
+mv_influencer_facets (021) reads influencer_tier and is recreated around
+it; idx_infl_tier_active (022) goes with the old column and is rebuilt
+CONCURRENTLY afterwards.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "027_generated_influencer_tier"
+down_revision = "026_influencer_search_payload"
+branch_labels = None
+depends_on = None
+
+
+TIER_EXPRESSION = (
+    "CASE"
+    " WHEN follower_count < 50000 THEN 'micro'"
+    " WHEN follower_count < 500000 THEN 'mid'"
+    " WHEN follower_count < 2000000 THEN 'macro'"
+    " WHEN follower_count >= 2000000 THEN 'mega'"
+    " END"
+)
+
+TIER_COMMENT = "Size tier: micro (<50K), mid (50K-500K), macro (500K-2M), mega (>2M)"
+
+FACET_DIMENSIONS = ["primary_niche", "influencer_tier", "influencer_gender", "content_language"]
+
+
+def _create_facets_view() -> None:
+    # Same definition as 021
+    inner = ",\n                ".join(f"COALESCE({d}, 'unknown') AS {d}" for d in FACET_DIMENSIONS)
+    outer = ",\n            ".join(
+        f"CASE WHEN GROUPING({d}) = 1 THEN '*' ELSE {d} END AS {d}" for d in FACET_DIMENSIONS
+    )
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW mv_influencer_facets AS
+        SELECT
+            {outer},
+            count(*) AS influencer_count,
+            percentile_cont(0.5) WITHIN GROUP (ORDER BY follower_count) AS median_followers
+        FROM (
+            SELECT
+                {inner},
+                follower_count
+            FROM influencers
+            WHERE profile_active
+        ) AS active
+        GROUP BY CUBE ({", ".join(FACET_DIMENSIONS)})
+    """)
+    op.create_index(
+        "idx_mv_influencer_facets_key",
+        "mv_influencer_facets",
+        FACET_DIMENSIONS,
+        unique=True,
+    )
+
+
+def _create_tier_index() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_infl_tier_active",
+            "influencers",
+            ["influencer_tier"],
+            postgresql_where=sa.text("profile_active"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def upgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_influencer_facets")
+    op.execute(
+        "ALTER TABLE influencers "
+        "DROP COLUMN influencer_tier, "
+        f"ADD COLUMN influencer_tier VARCHAR(10) GENERATED ALWAYS AS ({TIER_EXPRESSION}) STORED"
+    )
+    op.execute(f"COMMENT ON COLUMN influencers.influencer_tier IS '{TIER_COMMENT}'")
+    _create_facets_view()
+    _create_tier_index()
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_influencer_facets")
+    op.execute(
+        "ALTER TABLE influencers "
+        "DROP COLUMN influencer_tier, "
+        "ADD COLUMN influencer_tier VARCHAR(10)"
+    )
+    op.execute(f"COMMENT ON COLUMN influencers.influencer_tier IS '{TIER_COMMENT}'")
+    # Backfill what compute_tiers.py used to write
+    op.execute(f"UPDATE influencers SET influencer_tier = {TIER_EXPRESSION}")
+    _create_facets_view()
+    _create_tier_index()
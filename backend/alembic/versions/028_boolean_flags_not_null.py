@@ -0,0 +1,57 @@
+"""Make boolean flag columns NOT NULL with server defaults
+
+Revision ID: 028_boolean_flags_not_null
+Revises: 027_generated_influencer_tier
+Create Date: 2026-10-16
+
+The flag columns below were created nullable, so each one was three-valued:
+a NULL flag silently dropped out of filters like `WHERE is_active` and
+`WHERE is_saved = true`, and the planner had to allow for NULLs. The columns
+are backfilled with the default the models already use, then set NOT NULL.
+influencer_posts.is_sponsored (007) never had a server default, so it also
+gets one here.
+
+SET NOT NULL scans each table under an ACCESS EXCLUSIVE lock. All of these
+tables are small (a few thousand rows at most), and each one is altered in a
+single ALTER TABLE, so the lock is taken once per table.
+"""
+
+from alembic import op
+
+
+revision = "028_boolean_flags_not_null"
+down_revision = "027_generated_influencer_tier"
+branch_labels = None
+depends_on = None
+
+
+# table -> {column: server default}
+FLAG_COLUMNS = {
+    "influencers": {"is_verified": "false"},
+    "brands": {"is_active": "true"},
+    "ranking_presets": {"is_default": "false", "is_system": "false"},
+    "influencer_posts": {"is_sponsored": "false"},
+    "searches": {"is_saved": "false"},
+}
+
+
+def upgrade() -> None:
+    for table, columns in FLAG_COLUMNS.items():
+        for column, default in columns.items():
+            op.execute(f"UPDATE {table} SET {column} = {default} WHERE {column} IS NULL")
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(
+                f"ALTER COLUMN {column} SET DEFAULT {default}, ALTER COLUMN {column} SET NOT NULL"
+                for column, default in columns.items()
+            )
+        )
+
+
+def downgrade() -> None:
+    for table, columns in FLAG_COLUMNS.items():
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(f"ALTER COLUMN {column} DROP NOT NULL" for column in columns)
+        )
+    op.execute("ALTER TABLE influencer_posts ALTER COLUMN is_sponsored DROP DEFAULT")
@@ -0,0 +1,63 @@
+"""Index lower(country) on active profiles; drop unused influencer indexes
+
+Revision ID: 029_country_active_index
+Revises: 028_boolean_flags_not_null
+Create Date: 2026-10-16
+
+Every country filter in discovery (cache_service.find_by_interests,
+find_by_niche) compares `lower(country) = :country` on active profiles, so
+the plain btree on country (002) could never be used and Postgres filtered
+country row by row. It is replaced by a partial expression index matching
+that predicate, in the same shape as the niche index from 022.
+
+idx_influencers_niche_confidence (008) is also dropped: niche_confidence is
+only ever used as the sort key after a niche match, which idx_infl_discovery
+(023) already provides, so the index only added write cost.
+
+The ranking indexes on credibility/engagement/growth (013) already carry
+INCLUDE columns; a wider composite covering index would not help because
+the discovery queries load full Influencer rows.
+
+Built/dropped CONCURRENTLY so influencers stays writable.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "029_country_active_index"
+down_revision = "028_boolean_flags_not_null"
+branch_labels = None
+depends_on = None
+
+
+# dropped index -> column
+REPLACED_INDEXES = {
+    "idx_influencers_country": "country",
+    "idx_influencers_niche_confidence": "niche_confidence",
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_infl_country_active",
+            "influencers",
+            [sa.text("lower(country)")],
+            postgresql_where=sa.text("profile_active"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name in REPLACED_INDEXES:
+            op.drop_index(name, table_name="influencers", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, column in REPLACED_INDEXES.items():
+            op.create_index(
+                name, "influencers", [column], postgresql_concurrently=True, if_not_exists=True
+            )
+        op.drop_index(
+            "idx_infl_country_active", table_name="influencers", postgresql_concurrently=True, if_exists=True
+        )
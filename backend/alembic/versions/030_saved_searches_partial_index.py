@@ -0,0 +1,53 @@
+"""Replace the searches.is_saved index with a partial index for the saved list
+
+Revision ID: 030_saved_searches_partial_index
+Revises: 029_country_active_index
+Create Date: 2026-10-16
+
+The saved-search list (SearchService.get_saved_searches) runs
+
+    WHERE is_saved = true ORDER BY updated_at DESC LIMIT n
+
+idx_searches_saved (001) indexed the boolean over every search, so it
+mostly held history rows and still left the sort to do. It is replaced by a
+partial index on updated_at DESC over saved searches only. That index is
+tiny and returns the list already in order.
+
+idx_searches_executed stays a b-tree rather than BRIN. Search history is
+read with ORDER BY executed_at DESC LIMIT n, and only a b-tree can return
+rows in that order; BRIN would force a full sort of searches.
+
+Built/dropped CONCURRENTLY so searches stays writable.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "030_saved_searches_partial_index"
+down_revision = "029_country_active_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_searches_saved_recent",
+            "searches",
+            [sa.text("updated_at DESC")],
+            postgresql_where=sa.text("is_saved"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index("idx_searches_saved", table_name="searches", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_searches_saved", "searches", ["is_saved"], postgresql_concurrently=True, if_not_exists=True
+        )
+        op.drop_index(
+            "idx_searches_saved_recent", table_name="searches", postgresql_concurrently=True, if_exists=True
+        )
@@ -7,9 +7,11 @@ Endpoints for managing and querying the Spanish brand knowledge base.
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
+from operator import attrgetter
 from pydantic import BaseModel
 
 from app.core.database import get_db
+from app.core.responses import UTCJSONResponse
 from app.services.brand_import_service import BrandImportService
 
 router = APIRouter(prefix="/brands", tags=["Brands"])
@@ -33,6 +35,32 @@ class BrandResponse(BaseModel):
     brand_value_eur: Optional[int] = None
 
 
+# Brand attributes exposed by BrandResponse
+_BRAND_RESPONSE_FIELDS = tuple(BrandResponse.model_fields)
+_brand_getter = attrgetter(*_BRAND_RESPONSE_FIELDS)
+
+
+def _brand_payload(brand) -> dict:
+    """Project a Brand onto BrandResponse's fields.
+
+    Reads the attributes directly instead of building the full to_dict()
+    (extra_data, timestamps) and discarding most of it. The UUID id is left
+    as-is - orjson serializes it to the same string str() would.
+    """
+    return dict(zip(_BRAND_RESPONSE_FIELDS, _brand_getter(brand)))
+
+
+def _brand_list_response(brands) -> UTCJSONResponse:
+    """Serialize brands straight to JSON for the list endpoints.
+
+    Returning a Response skips FastAPI's per-row response_model validation
+    (response_model stays on the route for the OpenAPI schema); the rows come
+    from our own ORM objects, so only the projection to BrandResponse's
+    fields is needed.
+    """
+    return UTCJSONResponse([_brand_payload(b) for b in brands])
+
+
 class BrandCategoryCount(BaseModel):
     """Brand category with count."""
     category: str
@@ -69,7 +97,7 @@ async def list_brands(
     """
     service = BrandImportService(db)
     brands = await service.get_all_brands(category=category, limit=limit)
-    return [BrandResponse(**b.to_dict()) for b in brands]
+    return _brand_list_response(brands)
 
 
 @router.get("/categories", response_model=List[BrandCategoryCount])
@@ -98,7 +126,7 @@ async def search_brands(
     """
     service = BrandImportService(db)
     brands = await service.search_brands(query=q, category=category, limit=limit)
-    return [BrandResponse(**b.to_dict()) for b in brands]
+    return _brand_list_response(brands)
 
 
 @router.get("/count")
@@ -167,4 +195,4 @@ async def get_brand(
     if not brand:
         raise HTTPException(status_code=404, detail="Brand not found")
     
-    return BrandResponse(**brand.to_dict())
+    return UTCJSONResponse(_brand_payload(brand))
@@ -2,7 +2,6 @@ from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-import io
 
 from app.core.database import get_db
 from app.services.export_service import ExportService
@@ -22,20 +21,17 @@ async def export_csv(
     Returns a downloadable CSV file with all influencer data from the search.
     """
     service = ExportService(db)
-    try:
-        csv_content = await service.export_to_csv(search_id)
-
-        return Response(
-            content=csv_content,
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": f"attachment; filename=influencers_{search_id}.csv"
-            }
-        )
-    except ExportError as e:
-        raise HTTPException(status_code=404, detail=str(e.message))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
+    # Checked up front: once streaming starts the status code is already sent
+    if not await service.has_results(search_id):
+        raise HTTPException(status_code=404, detail=f"No results found for search {search_id}")
+
+    return StreamingResponse(
+        service.stream_csv(search_id),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f"attachment; filename=influencers_{search_id}.csv"
+        }
+    )
 
 
 @router.get("/{search_id}/excel")
@@ -1,20 +1,36 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy import text
+import asyncio
 import traceback
 import os
 
-from app.core.database import get_db
 from app.config import get_settings
 
 router = APIRouter(tags=["health"])
 
+# Liveness payload never changes - serialize it once instead of per request
+_HEALTH_BODY = b'{"status":"healthy"}'
+
+# A stuck database should fail the readiness probe, not hang it
+_READY_DB_TIMEOUT_SECONDS = 1.0
+
+# Set by the platform before the process starts, so read it once
+_VERCEL = os.environ.get("VERCEL", "false")
+
+
+async def _ping_db() -> None:
+    from app.core.database import get_session_maker
+
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        await db.execute(text("SELECT 1"))
+
 
 @router.get("/health")
 async def health_check():
     """Basic health check endpoint."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @router.get("/health/ready")
@@ -22,14 +38,23 @@ async def readiness_check():
     """
     Readiness check - verifies database connectivity.
     """
+    from app.core.database import db_init_error, db_init_pending, start_init_db
+
     try:
-        # Import here to catch any import errors
-        from app.core.database import get_session_maker
-        
-        session_maker = get_session_maker()
-        async with session_maker() as db:
-            await db.execute(text("SELECT 1"))
+        init_error = db_init_error()
+        if db_init_pending():
+            # Local dev: tables are still being created in the background
+            db_status = "initializing"
+        elif init_error is not None:
+            # Local dev: table creation failed - retry it so the probe can recover
+            start_init_db()
+            db_status = f"error: init failed: {init_error}"
+        else:
+            # The pool is only touched here - liveness (/health) never needs it
+            await asyncio.wait_for(_ping_db(), timeout=_READY_DB_TIMEOUT_SECONDS)
             db_status = "connected"
+    except asyncio.TimeoutError:
+        db_status = f"error: no response within {_READY_DB_TIMEOUT_SECONDS}s"
     except Exception as e:
         db_status = f"error: {str(e)}"
         # Log full traceback for debugging
@@ -41,9 +66,9 @@ async def readiness_check():
     except Exception as e:
         debug = False
 
-    return JSONResponse(content={
+    return ORJSONResponse(content={
         "status": "ready" if db_status == "connected" else "not_ready",
         "database": db_status,
         "debug": debug,
-        "vercel": os.environ.get("VERCEL", "false")
+        "vercel": _VERCEL
     })
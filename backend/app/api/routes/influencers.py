@@ -1,14 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
+import asyncio
 import logging
 
+from app.config import get_settings
 from app.core.database import get_db
+from app.core.responses import UTCJSONResponse
 from app.services.cache_service import CacheService
-from app.services.primetag_client import PrimeTagClient
-from app.schemas.influencer import InfluencerData
+from app.services.primetag_client import PrimeTagClient, get_primetag_client
+from app.schemas.influencer import InfluencerData, influencer_data_fields
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +43,17 @@ class CacheStatsResponse(BaseModel):
     cache_ttl_hours: int
 
 
+def _influencer_response(influencer) -> UTCJSONResponse:
+    """Serialize a cached influencer row (INFLUENCER_DATA_COLUMNS) as an
+    InfluencerData payload.
+
+    The row comes from our own typed columns, so the dict goes straight to
+    orjson instead of being validated into an InfluencerData and re-encoded
+    (response_model stays on the routes for the OpenAPI schema).
+    """
+    return UTCJSONResponse(influencer_data_fields(influencer))
+
+
 @router.get("/{influencer_id}", response_model=InfluencerData)
 async def get_influencer(
     influencer_id: UUID,
@@ -47,33 +61,12 @@ async def get_influencer(
 ):
     """Get detailed influencer data by ID."""
     cache_service = CacheService(db)
-    influencer = await cache_service.get_by_id(influencer_id)
+    influencer = await cache_service.get_data_by_id(influencer_id)
 
     if not influencer:
         raise HTTPException(status_code=404, detail=f"Influencer {influencer_id} not found")
 
-    return InfluencerData(
-        id=str(influencer.id),
-        username=influencer.username,
-        display_name=influencer.display_name,
-        profile_picture_url=influencer.profile_picture_url,
-        bio=influencer.bio,
-        is_verified=influencer.is_verified or False,
-        follower_count=influencer.follower_count or 0,
-        credibility_score=influencer.credibility_score,
-        engagement_rate=influencer.engagement_rate,
-        follower_growth_rate_6m=influencer.follower_growth_rate_6m,
-        avg_likes=influencer.avg_likes or 0,
-        avg_comments=influencer.avg_comments or 0,
-        avg_views=influencer.avg_views,
-        audience_genders=influencer.audience_genders or {},
-        audience_age_distribution=influencer.audience_age_distribution or {},
-        audience_geography=influencer.audience_geography or {},
-        interests=influencer.interests or [],
-        brand_mentions=influencer.brand_mentions or [],
-        platform_type=influencer.platform_type or "instagram",
-        cached_at=influencer.cached_at
-    )
+    return _influencer_response(influencer)
 
 
 @router.get("/username/{username}", response_model=InfluencerData)
@@ -84,7 +77,7 @@ async def get_influencer_by_username(
 ):
     """Get detailed influencer data by username."""
     cache_service = CacheService(db)
-    influencer = await cache_service.get_by_username(username, platform)
+    influencer = await cache_service.get_data_by_username(username, platform)
 
     if not influencer:
         raise HTTPException(
@@ -92,28 +85,7 @@ async def get_influencer_by_username(
             detail=f"Influencer @{username} not found. Try searching first."
         )
 
-    return InfluencerData(
-        id=str(influencer.id),
-        username=influencer.username,
-        display_name=influencer.display_name,
-        profile_picture_url=influencer.profile_picture_url,
-        bio=influencer.bio,
-        is_verified=influencer.is_verified or False,
-        follower_count=influencer.follower_count or 0,
-        credibility_score=influencer.credibility_score,
-        engagement_rate=influencer.engagement_rate,
-        follower_growth_rate_6m=influencer.follower_growth_rate_6m,
-        avg_likes=influencer.avg_likes or 0,
-        avg_comments=influencer.avg_comments or 0,
-        avg_views=influencer.avg_views,
-        audience_genders=influencer.audience_genders or {},
-        audience_age_distribution=influencer.audience_age_distribution or {},
-        audience_geography=influencer.audience_geography or {},
-        interests=influencer.interests or [],
-        brand_mentions=influencer.brand_mentions or [],
-        platform_type=influencer.platform_type or "instagram",
-        cached_at=influencer.cached_at
-    )
+    return _influencer_response(influencer)
 
 
 @router.get("/cache/stats", response_model=CacheStatsResponse)
@@ -133,7 +105,8 @@ async def get_cache_stats(
 @router.post("/cache/warm", response_model=CacheWarmResponse)
 async def warm_cache(
     request: CacheWarmRequest,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    primetag_client: PrimeTagClient = Depends(get_primetag_client)
 ):
     """
     Pre-emptively refresh cache entries close to expiration.
@@ -149,7 +122,6 @@ async def warm_cache(
         Count of influencers queued and refreshed
     """
     cache_service = CacheService(db)
-    primetag_client = PrimeTagClient()
     
     # Find expiring influencers
     expiring = await cache_service.get_expiring_soon(
@@ -165,24 +137,21 @@ async def warm_cache(
             failed_count=0
         )
     
-    refreshed_count = 0
-    failed_count = 0
-    
-    # Refresh each expiring influencer
-    for influencer in expiring:
-        try:
-            # Get mediakit URL to extract encrypted username
-            # If we don't have the encrypted username, we need to search first
-            if not influencer.profile_url:
-                logger.warning(f"No profile URL for {influencer.username}, skipping")
-                failed_count += 1
-                continue
-            
-            # Extract encrypted username from mediakit URL
-            encrypted_username = PrimeTagClient.extract_encrypted_username(
-                influencer.profile_url
-            )
-            
+    settings = get_settings()
+    semaphore = asyncio.Semaphore(settings.cache_warm_concurrency)
+
+    async def refresh_one(influencer) -> Optional[Dict[str, Any]]:
+        """Fetch fresh PrimeTag data for one influencer (None if not found).
+
+        Returns the upsert_influencers_bulk entry for it.
+
+        Only the PrimeTag calls run concurrently; the semaphore caps how many
+        are in flight, and the client's retry decorator honours Retry-After
+        on 429s.
+        """
+        async with semaphore:
+            encrypted_username = influencer.primetag_encrypted_username
+
             if not encrypted_username:
                 # Try searching by username
                 logger.info(f"Searching for {influencer.username} to refresh cache")
@@ -190,37 +159,56 @@ async def warm_cache(
                     influencer.username,
                     limit=1
                 )
-                
+
                 if not search_results:
                     logger.warning(f"Could not find {influencer.username} in PrimeTag")
-                    failed_count += 1
-                    continue
-                
+                    return None
+
                 encrypted_username = PrimeTagClient.extract_encrypted_username(
                     search_results[0].mediakit_url
                 )
-            
+
             if not encrypted_username:
                 logger.warning(f"Could not extract encrypted username for {influencer.username}")
-                failed_count += 1
-                continue
-            
+                return None
+
             # Fetch fresh data from PrimeTag
             detail = await primetag_client.get_media_kit_detail(encrypted_username)
-            metrics = primetag_client.extract_metrics(detail)
-            
-            # Update the cache with fresh data
-            # Create a minimal summary object for upsert
-            summary = type('Summary', (), {'username': influencer.username})()
-            await cache_service.upsert_influencer(summary, metrics, influencer.platform_type)
-            
-            refreshed_count += 1
-            logger.info(f"Refreshed cache for {influencer.username}")
-            
-        except Exception as e:
-            logger.error(f"Failed to refresh {influencer.username}: {str(e)}")
+            return {
+                'username': influencer.username,
+                'metrics': primetag_client.extract_metrics(detail),
+                'primetag_encrypted_username': encrypted_username,
+            }
+
+    outcomes = await asyncio.gather(
+        *(refresh_one(influencer) for influencer in expiring),
+        return_exceptions=True
+    )
+
+    refreshed_count = 0
+    failed_count = 0
+
+    # Buffer the refreshed rows per platform and write each group with one
+    # multi-row upsert (the session isn't safe for concurrent use anyway)
+    to_upsert: Dict[str, List[Dict[str, Any]]] = {}
+    for influencer, entry in zip(expiring, outcomes):
+        if isinstance(entry, Exception):
+            logger.error(f"Failed to refresh {influencer.username}: {str(entry)}")
             failed_count += 1
-    
+            continue
+        if entry is None:
+            failed_count += 1
+            continue
+        to_upsert.setdefault(influencer.platform_type, []).append(entry)
+
+    for platform_type, entries in to_upsert.items():
+        try:
+            refreshed_count += await cache_service.upsert_influencers_bulk(entries, platform_type)
+            logger.info(f"Refreshed cache for {len(entries)} {platform_type} influencers")
+        except Exception as e:
+            logger.error(f"Failed to write {len(entries)} refreshed {platform_type} influencers: {str(e)}")
+            failed_count += len(entries)
+
     # Commit all changes
     await db.commit()
     
@@ -4,6 +4,7 @@ from uuid import UUID
 from typing import List
 
 from app.core.database import get_db
+from app.core.responses import UTCJSONResponse
 from app.services.search_service import SearchService
 from app.schemas.search import (
     SearchRequest,
@@ -77,10 +78,22 @@ async def get_search(
     from sqlalchemy import select
     from app.models.search import SearchResult
     from app.models.influencer import Influencer
-    from app.schemas.influencer import RankedInfluencer, ScoreComponents, InfluencerData
+    from app.schemas.influencer import RankedInfluencer, ScoreComponents, influencer_to_data
+    from app.services.cache_service import INFLUENCER_DATA_COLUMNS
 
+    # Select only the columns the response needs, as plain Rows - no ORM
+    # instances to hydrate or register in the identity map
     query = (
-        select(SearchResult, Influencer)
+        select(
+            SearchResult.rank_position,
+            SearchResult.relevance_score,
+            SearchResult.credibility_score_normalized,
+            SearchResult.engagement_score_normalized,
+            SearchResult.audience_match_score,
+            SearchResult.growth_score_normalized,
+            SearchResult.geography_score,
+            *INFLUENCER_DATA_COLUMNS,
+        )
         .join(Influencer, SearchResult.influencer_id == Influencer.id)
         .where(SearchResult.search_id == search_id)
         .order_by(SearchResult.rank_position)
@@ -88,40 +101,29 @@ async def get_search(
     result = await db.execute(query)
     rows = result.all()
 
-    results = []
-    for sr, inf in rows:
-        influencer_data = InfluencerData(
-            id=str(inf.id),
-            username=inf.username,
-            display_name=inf.display_name,
-            profile_picture_url=inf.profile_picture_url,
-            bio=inf.bio,
-            is_verified=inf.is_verified,
-            follower_count=inf.follower_count or 0,
-            credibility_score=inf.credibility_score,
-            engagement_rate=inf.engagement_rate,
-            follower_growth_rate_6m=inf.follower_growth_rate_6m,
-            avg_likes=inf.avg_likes or 0,
-            avg_comments=inf.avg_comments or 0,
-            audience_genders=inf.audience_genders or {},
-            audience_age_distribution=inf.audience_age_distribution or {},
-            audience_geography=inf.audience_geography or {},
-        )
-
-        results.append(RankedInfluencer(
-            influencer_id=str(inf.id),
-            username=inf.username,
-            rank_position=sr.rank_position,
-            relevance_score=sr.relevance_score or 0,
-            scores=ScoreComponents(
-                credibility=sr.credibility_score_normalized or 0,
-                engagement=sr.engagement_score_normalized or 0,
-                audience_match=sr.audience_match_score or 0,
-                growth=sr.growth_score_normalized or 0,
-                geography=sr.geography_score or 0,
+    # Rows come from our own typed columns, so build the per-row models
+    # with model_construct() and skip re-validating every field;
+    # response_model still validates the assembled response once.
+    # Bound methods are hoisted out of the comprehension.
+    ranked = RankedInfluencer.model_construct
+    score_components = ScoreComponents.model_construct
+    results = [
+        ranked(
+            influencer_id=str(row.id),
+            username=row.username,
+            rank_position=row.rank_position,
+            relevance_score=row.relevance_score or 0,
+            scores=score_components(
+                credibility=row.credibility_score_normalized or 0,
+                engagement=row.engagement_score_normalized or 0,
+                audience_match=row.audience_match_score or 0,
+                growth=row.growth_score_normalized or 0,
+                geography=row.geography_score or 0,
             ),
-            raw_data=influencer_data
-        ))
+            raw_data=influencer_to_data(row),
+        )
+        for row in rows
+    ]
 
     return SearchResponse(
         search_id=str(search.id),
@@ -171,19 +173,19 @@ async def list_saved_searches(
     """Get all saved searches."""
     service = SearchService(db)
     searches = await service.get_saved_searches(limit=limit)
-    return [
-        SavedSearch(
-            id=str(s.id),
-            name=s.saved_name or "",
-            description=s.saved_description,
-            raw_query=s.raw_query,
-            parsed_query=s.parsed_query or {},
-            result_count=s.result_count or 0,
-            created_at=s.created_at,
-            updated_at=s.updated_at
-        )
+    return UTCJSONResponse([
+        {
+            "id": str(s.id),
+            "name": s.saved_name or "",
+            "description": s.saved_description,
+            "raw_query": s.raw_query,
+            "parsed_query": s.parsed_query or {},
+            "result_count": s.result_count or 0,
+            "created_at": s.created_at,
+            "updated_at": s.updated_at,
+        }
         for s in searches
-    ]
+    ])
 
 
 @router.get("/history/list", response_model=List[SearchHistoryItem])
@@ -194,14 +196,14 @@ async def list_search_history(
     """Get recent search history."""
     service = SearchService(db)
     searches = await service.get_search_history(limit=limit)
-    return [
-        SearchHistoryItem(
-            id=str(s.id),
-            raw_query=s.raw_query,
-            result_count=s.result_count or 0,
-            is_saved=s.is_saved or False,
-            saved_name=s.saved_name,
-            executed_at=s.executed_at
-        )
+    return UTCJSONResponse([
+        {
+            "id": str(s.id),
+            "raw_query": s.raw_query,
+            "result_count": s.result_count or 0,
+            "is_saved": s.is_saved,
+            "saved_name": s.saved_name,
+            "executed_at": s.executed_at,
+        }
         for s in searches
-    ]
+    ])
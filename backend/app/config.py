@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, computed_field
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import List, Optional
 from pathlib import Path
 import os
@@ -12,26 +12,34 @@ if not ENV_FILE_PATH.exists():
     ENV_FILE_PATH = None  # Don't fail if no .env file (Vercel injects env vars)
 
 
+# Query params asyncpg rejects in the URL (SSL and the pgbouncer statement
+# cache switch are configured in database.py)
+_UNSUPPORTED_URL_PARAMS = ("sslmode", "channel_binding", "ssl", "pgbouncer")
+
+
+@lru_cache()
 def clean_database_url(url: str) -> str:
     """Clean database URL for asyncpg compatibility.
     
     Neon uses sslmode=require but asyncpg doesn't support URL params for SSL.
     We remove unsupported params - SSL is configured separately in database.py.
+    Memoized: Settings.database_url is a computed property, so every access
+    would otherwise redo the scan.
     """
-    if "?" in url:
-        base_url, params = url.split("?", 1)
-        param_pairs = params.split("&")
-        # Filter out params that asyncpg doesn't support in URL
-        supported_params = [
-            p for p in param_pairs 
-            if not p.startswith("sslmode=") 
-            and not p.startswith("channel_binding=")
-            and not p.startswith("ssl=")
-        ]
-        if supported_params:
-            return base_url + "?" + "&".join(supported_params)
-        return base_url
-    return url
+    # Fast path: nothing to strip
+    if "?" not in url or not any(f"{p}=" in url for p in _UNSUPPORTED_URL_PARAMS):
+        return url
+
+    # Filter the raw key=value pairs so the remaining values keep their
+    # original percent-encoding
+    base_url, params = url.split("?", 1)
+    supported_params = [
+        p for p in params.split("&")
+        if p.split("=", 1)[0] not in _UNSUPPORTED_URL_PARAMS
+    ]
+    if supported_params:
+        return base_url + "?" + "&".join(supported_params)
+    return base_url
 
 
 def needs_ssl(url: str) -> bool:
@@ -45,11 +53,26 @@ def needs_ssl(url: str) -> bool:
     return False
 
 
+def uses_transaction_pooler(url: str) -> bool:
+    """Check if the database URL points at a transaction-mode PgBouncer.
+
+    Neon's pooled endpoints carry a "-pooler" host suffix. Named prepared
+    statements don't survive across transactions there, so the statement
+    caches must stay off.
+    """
+    host = url.split("@", 1)[-1].split("/", 1)[0]
+    return "-pooler" in host or "pgbouncer=true" in url
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
     # Database - raw URL from environment
     database_url_raw: str = Field(..., validation_alias="DATABASE_URL")
+    # Per-process connection pool. Every warm serverless instance holds its
+    # own pool, so keep these small; raise them for a long-lived server.
+    db_pool_size: int = Field(default=5, validation_alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=0, validation_alias="DB_MAX_OVERFLOW")
 
     @computed_field
     @property
@@ -76,6 +99,7 @@ class Settings(BaseSettings):
     # Cache settings
     cache_ttl_seconds: int = Field(default=900)  # 15 minutes
     influencer_cache_hours: int = Field(default=24)
+    cache_warm_concurrency: int = Field(default=10)  # parallel PrimeTag refreshes
 
     # Search defaults
     default_min_credibility: float = Field(
@@ -97,9 +121,12 @@ class Settings(BaseSettings):
     # Vercel URL (auto-set by Vercel)
     vercel_url: str = Field(default="", validation_alias="VERCEL_URL")
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins from comma-separated string, plus Vercel URLs."""
+        """Parse CORS origins from comma-separated string, plus Vercel URLs.
+
+        Computed once per (cached) Settings instance.
+        """
         origins = [origin.strip() for origin in self.cors_origins.split(",")]
         # Add Vercel URL if present
         if self.vercel_url:
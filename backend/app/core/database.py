@@ -1,5 +1,12 @@
+import asyncio
+import logging
 import ssl
+import threading
+from functools import lru_cache
+from sqlalchemy import Column, DateTime, text
+from sqlalchemy.sql import func
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.orm import DeclarativeBase
 from typing import AsyncGenerator, Optional
 
@@ -9,56 +16,144 @@ class Base(DeclarativeBase):
     pass
 
 
+class TimestampMixin:
+    """created_at/updated_at timestamptz columns, defaulted by the database."""
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+logger = logging.getLogger(__name__)
+
 # Lazy-loaded engine and session maker for serverless compatibility
 _engine = None
 _async_session_maker = None
+_init_lock = threading.Lock()
+
+# Schema setup started by the local-dev lifespan; None when nothing is pending
+_db_ready: Optional[asyncio.Task] = None
+
+# Per-connection prepared statement cache (asyncpg + SQLAlchemy's adapter)
+STATEMENT_CACHE_SIZE = 1024
+
+
+@lru_cache()
+def get_ssl_context() -> ssl.SSLContext:
+    """SSL context for asyncpg connections to Neon and other cloud databases.
+
+    Built once per process and shared by the app engine and the CLI scripts.
+    """
+    ssl_context = ssl.create_default_context()
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+
+def _create_engine():
+    """Build the app's async engine from settings."""
+    from app.config import get_settings, needs_ssl, uses_transaction_pooler
+    settings = get_settings()
+    
+    # Disable PG JIT: our queries are short lookups where JIT compilation
+    # costs more than it saves.
+    # Type introspection needs no extra setup: every column type we use is
+    # a Postgres builtin that asyncpg decodes without querying pg_catalog,
+    # leaving only the dialect's json/jsonb codec registration (two
+    # lookups) per new connection - paid once per pooled connection, and
+    # asyncpg's per-connection statement cache keeps the codecs after that.
+    connect_args = {
+        "server_settings": {"jit": "off", "application_name": "influencer-discovery"},
+    }
+
+    # Keep hot point lookups (get_by_id / get_by_username) prepared on
+    # each pooled connection so repeat requests skip parse/plan. PgBouncer
+    # in transaction mode can't hold prepared statements across
+    # transactions, so both caches are disabled behind Neon's pooler.
+    cache_size = 0 if uses_transaction_pooler(settings.database_url_raw) else STATEMENT_CACHE_SIZE
+    connect_args["statement_cache_size"] = cache_size
+    connect_args["prepared_statement_cache_size"] = cache_size
+
+    # Configure SSL for Neon and other cloud databases
+    if needs_ssl(settings.database_url_raw):
+        connect_args["ssl"] = get_ssl_context()
+    
+    # Pool explicitly with the asyncio-aware queue pool (Alembic keeps
+    # NullPool). pre_ping + recycle drop connections that serverless
+    # Postgres closed while the instance sat idle; pool_timeout fails a
+    # request fast instead of queueing it for the 30s default when every
+    # connection is checked out.
+    engine = create_async_engine(
+        settings.database_url,
+        echo=settings.debug,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=300,
+        pool_timeout=5,
+        connect_args=connect_args,
+    )
+    logger.info(f"Created database engine id={id(engine)}")
+    return engine
 
 
 def get_engine():
-    """Get or create the async engine (lazy initialization)."""
+    """Get or create the async engine (lazy initialization).
+
+    Double-checked under a lock so threads racing on a cold start still end
+    up sharing a single engine (and connection pool) per process.
+    """
     global _engine
     if _engine is None:
-        from app.config import get_settings, needs_ssl
-        settings = get_settings()
-        
-        # Configure SSL for Neon and other cloud databases
-        connect_args = {}
-        if needs_ssl(settings.database_url_raw):
-            # Create SSL context for asyncpg
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            connect_args["ssl"] = ssl_context
-        
-        _engine = create_async_engine(
-            settings.database_url,
-            echo=settings.debug,
-            pool_pre_ping=True,
-            connect_args=connect_args,
-        )
+        with _init_lock:
+            if _engine is None:
+                _engine = _create_engine()
     return _engine
 
 
+async def dispose_engine():
+    """Close every pooled connection and drop the engine (process shutdown)."""
+    global _engine, _async_session_maker
+    with _init_lock:
+        engine, _engine, _async_session_maker = _engine, None, None
+    if engine is not None:
+        await engine.dispose()
+
+
 def get_session_maker():
     """Get or create the session maker (lazy initialization)."""
     global _async_session_maker
     if _async_session_maker is None:
-        _async_session_maker = async_sessionmaker(
-            get_engine(),
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
+        engine = get_engine()
+        with _init_lock:
+            if _async_session_maker is None:
+                _async_session_maker = async_sessionmaker(
+                    engine,
+                    class_=AsyncSession,
+                    expire_on_commit=False,
+                )
     return _async_session_maker
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting database sessions."""
+    if _db_ready is not None:
+        await wait_db_ready()
     session_maker = get_session_maker()
+    # The context manager closes the session on exit
     async with session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
+
+
+async def warm_db_pool():
+    """Open a pooled connection ahead of the first query.
+
+    The engine is module-level, so the connection stays in the pool and is
+    reused by later requests handled by the same (warm) serverless instance.
+    """
+    engine = get_engine()
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
 
 
 async def init_db():
@@ -66,3 +161,40 @@ async def init_db():
     engine = get_engine()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+def start_init_db() -> asyncio.Task:
+    """Run init_db() in the background so the app can start serving at once.
+
+    Requests that need a session wait for it in get_db(); /health never does.
+    """
+    global _db_ready
+    _db_ready = asyncio.create_task(init_db())
+    return _db_ready
+
+
+async def wait_db_ready():
+    """Wait for the start_init_db() task, re-raising its error if it failed.
+
+    A failed init (e.g. the database was unreachable at startup) is retried
+    by the next caller instead of being re-raised forever. Shielded so a
+    cancelled request doesn't cancel the shared init task.
+    """
+    task = _db_ready
+    if task is None:
+        return
+    if db_init_error() is not None:
+        task = start_init_db()
+    await asyncio.shield(task)
+
+
+def db_init_pending() -> bool:
+    """True while a start_init_db() task is still running."""
+    return _db_ready is not None and not _db_ready.done()
+
+
+def db_init_error() -> Optional[BaseException]:
+    """The error from the last start_init_db() task, if it failed."""
+    if _db_ready is None or not _db_ready.done() or _db_ready.cancelled():
+        return None
+    return _db_ready.exception()
@@ -0,0 +1,69 @@
+"""ASGI middleware used by the FastAPI app."""
+
+from typing import List, Tuple
+
+# Same method list Starlette's CORSMiddleware expands "*" to
+_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+_PREFLIGHT_MAX_AGE = b"600"
+
+
+class AllowAllCORSMiddleware:
+    """CORS for an allow-all-origins, credentialed policy with precomputed headers.
+
+    Equivalent to ``CORSMiddleware(allow_origins=["*"], allow_credentials=True,
+    allow_methods=["*"], allow_headers=["*"])``, but since every decision is
+    constant the headers are kept as raw bytes and spliced into the response
+    instead of being rebuilt through Starlette's header objects per request.
+
+    With credentials allowed the browser rejects a literal ``*`` origin, so the
+    request's Origin is echoed back (as Starlette does for cookie requests).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        # Not a CORS request - nothing to add
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers: List[Tuple[bytes, bytes]] = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            # Preflight: answer directly without touching the router
+            cors_headers.append((b"access-control-allow-methods", _ALLOW_METHODS))
+            cors_headers.append((b"access-control-max-age", _PREFLIGHT_MAX_AGE))
+            if request_headers is not None:
+                cors_headers.append((b"access-control-allow-headers", request_headers))
+            cors_headers.append((b"content-type", b"text/plain; charset=utf-8"))
+            cors_headers.append((b"content-length", b"2"))
+            await send({"type": "http.response.start", "status": 200, "headers": cors_headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
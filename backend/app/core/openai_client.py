@@ -0,0 +1,42 @@
+"""
+Process-wide AsyncOpenAI client.
+
+Building an AsyncOpenAI creates a fresh httpx pool, so every call paid a new
+TCP + TLS handshake to the API. One shared client keeps those connections
+alive between requests on a warm instance.
+"""
+import asyncio
+from typing import TYPE_CHECKING, Optional
+
+from app.config import get_settings
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+_client: Optional["AsyncOpenAI"] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_openai_client() -> "AsyncOpenAI":
+    """Shared AsyncOpenAI client for the running event loop.
+
+    httpx pools are bound to the event loop that created them, so a new
+    client is made if the running loop has changed. openai is imported on
+    first use to keep it off the cold-start path.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        from openai import AsyncOpenAI
+
+        _client = AsyncOpenAI(api_key=get_settings().openai_api_key)
+        _client_loop = loop
+    return _client
+
+
+async def close_openai_client() -> None:
+    """Close the shared client's connections (app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
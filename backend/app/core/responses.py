@@ -0,0 +1,19 @@
+"""
+Response class for routes that return pre-built payloads.
+
+Those routes hand dicts straight to orjson instead of letting FastAPI
+validate them against response_model (which stays on the route for the
+OpenAPI schema). orjson writes a UTC datetime as "+00:00" by default, while
+pydantic writes "Z"; OPT_UTC_Z keeps every route on pydantic's format.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class UTCJSONResponse(ORJSONResponse):
+    """ORJSONResponse that renders UTC timestamps as "...Z", like pydantic."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
@@ -0,0 +1,28 @@
+"""
+Time-ordered UUIDs (version 7, RFC 9562) for primary keys.
+
+uuid4 keys land at random positions in the primary-key btree, so every
+insert touches a different leaf page. A v7 UUID starts with a millisecond
+Unix timestamp, so new rows append to the right edge of the index like a
+serial id would, while staying globally unique and unguessable.
+"""
+import os
+import time
+import uuid
+
+_TIMESTAMP_MASK = (1 << 48) - 1
+_RAND_B_MASK = (1 << 62) - 1
+
+
+def uuid7() -> uuid.UUID:
+    """Return a new UUIDv7: 48-bit ms timestamp, then 74 random bits."""
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (timestamp_ms & _TIMESTAMP_MASK) << 80
+        | 0x7 << 76                      # version
+        | (rand >> 68) << 64             # rand_a (12 bits)
+        | 0b10 << 62                     # RFC 9562 variant
+        | rand & _RAND_B_MASK            # rand_b (62 bits)
+    )
+    return uuid.UUID(int=value)
@@ -1,13 +1,30 @@
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+
+# Set by the platform (or api/index.py) before this module is imported
+IS_VERCEL = bool(os.environ.get("VERCEL"))
+
+# Writes log records to stdout off the event loop; see setup_logging()
+_log_listener = None
 
 
 def setup_logging():
-    """Configure logging to show detailed search progress in terminal."""
+    """Configure logging to show detailed search progress in terminal.
+
+    App loggers only enqueue records; a QueueListener thread formats them and
+    does the blocking stdout write, so logging never stalls a request. On
+    Vercel the function can freeze as soon as a response is sent, leaving
+    queued records unwritten, so there the handler writes directly.
+    """
+    global _log_listener
     # Create a custom formatter for clean output
     formatter = logging.Formatter(
         fmt="%(message)s",  # Clean output for our formatted logs
@@ -19,11 +36,24 @@ def setup_logging():
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
     
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+    if IS_VERCEL:
+        app_handler = console_handler
+    else:
+        log_queue = queue.SimpleQueue()
+        _log_listener = logging.handlers.QueueListener(
+            log_queue, console_handler, respect_handler_level=True
+        )
+        _log_listener.start()
+        app_handler = logging.handlers.QueueHandler(log_queue)
+
     # Configure the app logger (covers all app.* modules)
     app_logger = logging.getLogger("app")
     app_logger.setLevel(logging.INFO)
     app_logger.handlers = []  # Clear any existing handlers
-    app_logger.addHandler(console_handler)
+    app_logger.addHandler(app_handler)
     app_logger.propagate = False  # Don't propagate to root logger
     
     # Also log uvicorn access at INFO level (optional)
@@ -31,6 +61,19 @@ def setup_logging():
     uvicorn_logger.setLevel(logging.INFO)
 
 
+def stop_logging():
+    """Flush queued log records and stop the listener thread.
+
+    The app logger is switched back to writing stdout directly, so records
+    logged after shutdown aren't left in a queue nobody drains.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        logging.getLogger("app").handlers = list(_log_listener.handlers)
+        _log_listener = None
+
+
 # Initialize logging on module load
 setup_logging()
 
@@ -39,20 +82,29 @@ def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     # Import here to avoid circular imports and module-level execution issues
     from app.config import get_settings
-    from app.core.database import init_db
+    from app.core.database import dispose_engine, start_init_db
+    from app.core.middleware import AllowAllCORSMiddleware
+    from app.core.openai_client import close_openai_client
+    from app.services.primetag_client import close_primetag_client
     from app.api.routes import search_router, influencers_router, exports_router, health_router, brands_router, idea_match_router
     
     settings = get_settings()
-    is_vercel = os.environ.get("VERCEL", False)
 
     # Lifespan for non-serverless environments (local dev)
     # Vercel doesn't support lifespan events
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         """Application lifespan events (only for local dev)."""
-        if not is_vercel:
-            await init_db()
+        # Create tables in the background: /health answers right away and
+        # DB-backed requests wait for it in get_db()
+        db_ready = None if IS_VERCEL else start_init_db()
         yield
+        if db_ready is not None and not db_ready.done():
+            db_ready.cancel()
+        await dispose_engine()
+        await close_primetag_client()
+        await close_openai_client()
+        stop_logging()
 
     app = FastAPI(
         title="Influencer Discovery Tool",
@@ -73,21 +125,27 @@ def create_app() -> FastAPI:
         3. Export results or save the search
         """,
         version="1.0.0",
-        lifespan=None if is_vercel else lifespan,
-        docs_url="/api/docs" if is_vercel else "/docs",
-        redoc_url="/api/redoc" if is_vercel else "/redoc",
+        # orjson serializes responses several times faster than stdlib json
+        default_response_class=ORJSONResponse,
+        lifespan=None if IS_VERCEL else lifespan,
+        docs_url="/api/docs" if IS_VERCEL else "/docs",
+        redoc_url="/api/redoc" if IS_VERCEL else "/redoc",
         # Disable automatic trailing slash redirects to prevent redirect loops on Vercel
         redirect_slashes=False,
     )
 
-    # Configure CORS - allow all origins on Vercel
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"] if is_vercel else settings.cors_origins_list,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    # Configure CORS - allow all origins on Vercel. That policy is constant,
+    # so it uses precomputed headers instead of Starlette's CORSMiddleware.
+    if IS_VERCEL:
+        app.add_middleware(AllowAllCORSMiddleware)
+    else:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=settings.cors_origins_list,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
 
     # Include routers - all under /api prefix for Vercel routing
     app.include_router(health_router, prefix="/api")
@@ -102,7 +160,7 @@ def create_app() -> FastAPI:
 
 # Only create app instance when running directly (not when imported by Vercel)
 # Vercel's api/index.py will call create_app() directly
-if not os.environ.get("VERCEL"):
+if not IS_VERCEL:
     app = create_app()
 
 
@@ -1,9 +1,9 @@
 from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
-import uuid
 
 from app.core.database import Base
+from app.core.uuid7 import uuid7
 
 
 class APIAuditLog(Base):
@@ -11,7 +11,7 @@ class APIAuditLog(Base):
 
     __tablename__ = "api_audit_log"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Request details
     endpoint = Column(String(255), nullable=False)
@@ -31,6 +31,10 @@ class APIAuditLog(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (
-        Index("idx_api_audit_created", "created_at"),
+        # Append-only table: BRIN over created_at (migration 016)
+        Index(
+            "idx_api_audit_created", "created_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+        ),
         Index("idx_api_audit_endpoint", "endpoint"),
     )
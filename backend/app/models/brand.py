@@ -1,15 +1,21 @@
 """Brand model for Spanish brand knowledge base."""
 
-from sqlalchemy import Column, String, Integer, BigInteger, Boolean, DateTime, Text, Index
+from sqlalchemy import Column, String, Integer, BigInteger, Boolean, Text, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.sql import func
-import uuid
 import unicodedata
 import re
+from functools import lru_cache
+from operator import attrgetter
 
-from app.core.database import Base
+from app.core.database import Base, TimestampMixin
+from app.core.uuid7 import uuid7
 
 
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^a-z0-9\s]')
+
+
+@lru_cache(maxsize=4096)
 def normalize_brand_name(name: str) -> str:
     """
     Normalize brand name for deduplication.
@@ -18,6 +24,8 @@ def normalize_brand_name(name: str) -> str:
     - Removes accents/diacritics
     - Removes special characters except spaces
     - Collapses multiple spaces
+
+    Memoized: the same names recur across bulk imports and lookups.
     """
     if not name:
         return ""
@@ -25,20 +33,23 @@ def normalize_brand_name(name: str) -> str:
     # Convert to lowercase
     normalized = name.lower()
     
-    # Remove accents/diacritics (NFD decomposes, then we remove combining characters)
+    # Remove accents/diacritics: NFD splits them into combining characters,
+    # which the ASCII encode then drops. Unicode whitespace is folded to
+    # spaces first so it survives the encode.
     normalized = unicodedata.normalize('NFD', normalized)
-    normalized = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
+    normalized = _WHITESPACE_RE.sub(' ', normalized)
+    normalized = normalized.encode('ascii', 'ignore').decode('ascii')
     
     # Remove special characters except alphanumeric and spaces
-    normalized = re.sub(r'[^a-z0-9\s]', '', normalized)
+    normalized = _SPECIAL_CHARS_RE.sub('', normalized)
     
     # Collapse multiple spaces and strip
-    normalized = re.sub(r'\s+', ' ', normalized).strip()
+    normalized = _WHITESPACE_RE.sub(' ', normalized).strip()
     
     return normalized
 
 
-class Brand(Base):
+class Brand(TimestampMixin, Base):
     """
     Spanish brand knowledge base entry.
     
@@ -47,7 +58,7 @@ class Brand(Base):
 
     __tablename__ = "brands"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Core brand identity
     name = Column(String(255), nullable=False)
@@ -74,21 +85,20 @@ class Brand(Base):
     brand_value_eur = Column(BigInteger, nullable=True)  # Brand value in euros if available
 
     # Status
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, default=True, nullable=False, server_default="true")
 
     # Flexible storage for additional data
     extra_data = Column(JSONB, nullable=True)
 
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
-
     __table_args__ = (
         Index("idx_brands_name_normalized", "name_normalized", unique=True),
         Index("idx_brands_category", "category"),
         Index("idx_brands_industry", "industry"),
         Index("idx_brands_source", "source"),
-        Index("idx_brands_extra_data", "extra_data", postgresql_using="gin"),
+        Index(
+            "idx_brands_extra_data", "extra_data",
+            postgresql_using="gin", postgresql_ops={"extra_data": "jsonb_path_ops"},
+        ),
     )
 
     def __init__(self, **kwargs):
@@ -99,25 +109,14 @@ class Brand(Base):
 
     def to_dict(self) -> dict:
         """Convert to dictionary for API responses."""
-        return {
-            "id": str(self.id),
-            "name": self.name,
-            "name_normalized": self.name_normalized,
-            "description": self.description,
-            "category": self.category,
-            "subcategory": self.subcategory,
-            "industry": self.industry,
-            "headquarters": self.headquarters,
-            "website": self.website,
-            "instagram_handle": self.instagram_handle,
-            "source": self.source,
-            "source_rank": self.source_rank,
-            "brand_value_eur": self.brand_value_eur,
-            "is_active": self.is_active,
-            "extra_data": self.extra_data or {},
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        data = dict(zip(_TO_DICT_FIELDS, _to_dict_getter(self)))
+        data["id"] = str(self.id)
+        data["extra_data"] = self.extra_data or {}
+        if self.created_at:
+            data["created_at"] = self.created_at.isoformat()
+        if self.updated_at:
+            data["updated_at"] = self.updated_at.isoformat()
+        return data
 
     def to_summary(self) -> dict:
         """Return a brief summary for search context."""
@@ -129,3 +128,26 @@ class Brand(Base):
 
     def __repr__(self) -> str:
         return f"<Brand(name='{self.name}', category='{self.category}')>"
+
+
+# to_dict() keys, in response order
+_TO_DICT_FIELDS = (
+    "id",
+    "name",
+    "name_normalized",
+    "description",
+    "category",
+    "subcategory",
+    "industry",
+    "headquarters",
+    "website",
+    "instagram_handle",
+    "source",
+    "source_rank",
+    "brand_value_eur",
+    "is_active",
+    "extra_data",
+    "created_at",
+    "updated_at",
+)
+_to_dict_getter = attrgetter(*_TO_DICT_FIELDS)
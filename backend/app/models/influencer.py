@@ -1,13 +1,14 @@
-from sqlalchemy import Column, String, Integer, BigInteger, Float, Boolean, DateTime, Text, Index
+from sqlalchemy import Column, String, Integer, BigInteger, Float, Boolean, DateTime, Text, Index, Computed, DDL, event
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
-import uuid
+from operator import attrgetter
 
-from app.core.database import Base
+from app.core.database import Base, TimestampMixin
+from app.core.uuid7 import uuid7
 
 
-class Influencer(Base):
+class Influencer(TimestampMixin, Base):
     """Cached influencer data from PrimeTag.
     
     Stores discovery data (interests, brand_mentions, country) for matching briefs,
@@ -16,7 +17,7 @@ class Influencer(Base):
 
     __tablename__ = "influencers"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # PrimeTag identifiers
     platform_type = Column(String(20), nullable=False, default="instagram")
@@ -28,11 +29,26 @@ class Influencer(Base):
     display_name = Column(String(255), nullable=True)
     profile_picture_url = Column(Text, nullable=True)
     bio = Column(Text, nullable=True)
-    is_verified = Column(Boolean, default=False)
+    is_verified = Column(Boolean, default=False, nullable=False, server_default="false")
 
     # Core metrics (cached from PrimeTag)
     follower_count = Column(BigInteger, nullable=True)
 
+    # Size tier, generated by Postgres from follower_count (migration 027):
+    # micro (<50K), mid (50K-500K), macro (500K-2M), mega (>=2M)
+    influencer_tier = Column(
+        String(10),
+        Computed(
+            "CASE"
+            " WHEN follower_count < 50000 THEN 'micro'"
+            " WHEN follower_count < 500000 THEN 'mid'"
+            " WHEN follower_count < 2000000 THEN 'macro'"
+            " WHEN follower_count >= 2000000 THEN 'mega'"
+            " END",
+            persisted=True,
+        ),
+    )
+
     # Quality metrics (cached from PrimeTag) - used for verification
     credibility_score = Column(Float, nullable=True)  # audience_credibility_percentage
     engagement_rate = Column(Float, nullable=True)  # avg_engagement_rate (as decimal, e.g., 0.0345)
@@ -69,6 +85,17 @@ class Influencer(Base):
     # Structure: {"detected_themes": [...], "narrative_style": "...", "format_preference": [...], "avg_caption_length": N}
     content_themes = Column(JSONB, nullable=True)
 
+    # Niche/brand/theme/language in one JSONB for containment search (migration 026):
+    #   WHERE search_payload @> '{"brands": ["nike"], "niche": "padel"}'
+    # Generated by Postgres; deferred so regular loads don't fetch it.
+    search_payload = deferred(Column(
+        JSONB,
+        Computed(
+            "influencer_search_payload(detected_brands, content_themes, primary_niche, content_language)",
+            persisted=True,
+        ),
+    ))
+
     # Relationship to posts
     posts = relationship("InfluencerPost", back_populates="influencer", cascade="all, delete-orphan")
 
@@ -83,60 +110,145 @@ class Influencer(Base):
     cached_at = Column(DateTime(timezone=True), server_default=func.now())
     cache_expires_at = Column(DateTime(timezone=True), nullable=True)
 
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
-
     __table_args__ = (
         Index("idx_influencers_platform_username", "platform_type", "username", unique=True),
-        Index("idx_influencers_credibility", "credibility_score"),
-        Index("idx_influencers_engagement", "engagement_rate"),
-        Index("idx_influencers_growth", "follower_growth_rate_6m"),
-        Index("idx_influencers_cache_expiry", "cache_expires_at"),
-        Index("idx_influencers_country", "country"),
-        Index("idx_influencers_interests", "interests", postgresql_using="gin"),
-        Index("idx_influencers_brand_mentions", "brand_mentions", postgresql_using="gin"),
+        Index(
+            "idx_influencers_platform_followers",
+            "platform_type",
+            follower_count.desc().nulls_last(),
+            postgresql_where=follower_count.isnot(None),
+        ),
+        # Partial, covering DESC indexes for top-K ranking scans (migration 013)
+        Index(
+            "idx_influencers_credibility",
+            credibility_score.desc().nulls_last(),
+            postgresql_where=credibility_score.isnot(None),
+            postgresql_include=["username", "follower_count", "engagement_rate"],
+        ),
+        Index(
+            "idx_influencers_engagement",
+            engagement_rate.desc().nulls_last(),
+            postgresql_where=engagement_rate.isnot(None),
+            postgresql_include=["username", "follower_count", "credibility_score"],
+        ),
+        Index(
+            "idx_influencers_growth",
+            follower_growth_rate_6m.desc().nulls_last(),
+            postgresql_where=follower_growth_rate_6m.isnot(None),
+            postgresql_include=["username", "follower_count", "engagement_rate"],
+        ),
+        Index(
+            "idx_influencers_cache_expiry",
+            "cache_expires_at",
+            postgresql_where=cache_expires_at.isnot(None),
+        ),
+        # Country filter of the discovery queries, active profiles only (029)
+        Index(
+            "idx_infl_country_active",
+            func.lower(country),
+            postgresql_where=profile_active,
+        ),
+        Index(
+            "idx_influencers_interests", "interests",
+            postgresql_using="gin", postgresql_ops={"interests": "jsonb_path_ops"},
+        ),
+        Index(
+            "idx_influencers_brand_mentions", "brand_mentions",
+            postgresql_using="gin", postgresql_ops={"brand_mentions": "jsonb_path_ops"},
+        ),
         # Niche detection indexes
-        Index("idx_influencers_primary_niche", "primary_niche"),
-        Index("idx_influencers_niche_confidence", "niche_confidence"),
-        Index("idx_influencers_detected_brands", "detected_brands", postgresql_using="gin"),
+        # Niche discovery lookup + ranking order, active profiles only (022/023)
+        Index(
+            "idx_infl_discovery",
+            func.lower(primary_niche),
+            niche_confidence.desc().nulls_last(),
+            postgresql_where=profile_active,
+        ),
         Index("idx_influencers_content_language", "content_language"),
-        Index("idx_influencers_content_themes", "content_themes", postgresql_using="gin"),
-        Index("idx_influencers_influencer_gender", "influencer_gender"),
+        Index(
+            "idx_infl_payload", "search_payload",
+            postgresql_using="gin", postgresql_ops={"search_payload": "jsonb_path_ops"},
+            postgresql_where=profile_active,
+        ),
+        Index(
+            "idx_infl_tier_active",
+            "influencer_tier",
+            postgresql_where=profile_active,
+        ),
+        Index(
+            "idx_infl_gender_active",
+            "influencer_gender",
+            postgresql_where=profile_active,
+        ),
     )
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for API responses."""
-        return {
-            "id": str(self.id),
-            "platform_type": self.platform_type,
-            "username": self.username,
-            "display_name": self.display_name,
-            "profile_picture_url": self.profile_picture_url,
-            "bio": self.bio,
-            "is_verified": self.is_verified,
-            "follower_count": self.follower_count,
-            "credibility_score": self.credibility_score,
-            "engagement_rate": self.engagement_rate,
-            "follower_growth_rate_6m": self.follower_growth_rate_6m,
-            "avg_likes": self.avg_likes,
-            "avg_comments": self.avg_comments,
-            "avg_views": self.avg_views,
-            "audience_genders": self.audience_genders or {},
-            "audience_age_distribution": self.audience_age_distribution or {},
-            "audience_geography": self.audience_geography or {},
-            "interests": self.interests or [],
-            "brand_mentions": self.brand_mentions or [],
-            "country": self.country,
-            "post_content_aggregated": self.post_content_aggregated,
-            # Niche detection fields
-            "primary_niche": self.primary_niche,
-            "niche_confidence": self.niche_confidence,
-            "detected_brands": self.detected_brands or [],
-            "sponsored_ratio": self.sponsored_ratio,
-            "content_language": self.content_language,
-            "content_themes": self.content_themes,
-            "influencer_gender": self.influencer_gender,
-            "profile_active": self.profile_active,
-            "cached_at": self.cached_at.isoformat() if self.cached_at else None,
-        }
+        """Convert to dictionary for API responses.
+
+        All columns are read in one attrgetter call; only the few that need
+        converting are fixed up afterwards.
+        """
+        data = dict(zip(_TO_DICT_FIELDS, _to_dict_getter(self)))
+        data["id"] = str(self.id)
+        for key in _JSON_OBJECT_FIELDS:
+            data[key] = data[key] or {}
+        for key in _JSON_ARRAY_FIELDS:
+            data[key] = data[key] or []
+        if self.cached_at:
+            data["cached_at"] = self.cached_at.isoformat()
+        return data
+
+
+# to_dict() keys, in response order
+_TO_DICT_FIELDS = (
+    "id",
+    "platform_type",
+    "username",
+    "display_name",
+    "profile_picture_url",
+    "bio",
+    "is_verified",
+    "follower_count",
+    "credibility_score",
+    "engagement_rate",
+    "follower_growth_rate_6m",
+    "avg_likes",
+    "avg_comments",
+    "avg_views",
+    "audience_genders",
+    "audience_age_distribution",
+    "audience_geography",
+    "interests",
+    "brand_mentions",
+    "country",
+    "post_content_aggregated",
+    # Niche detection fields
+    "primary_niche",
+    "niche_confidence",
+    "detected_brands",
+    "sponsored_ratio",
+    "content_language",
+    "content_themes",
+    "influencer_gender",
+    "profile_active",
+    "cached_at",
+)
+_to_dict_getter = attrgetter(*_TO_DICT_FIELDS)
+_JSON_OBJECT_FIELDS = ("audience_genders", "audience_age_distribution", "audience_geography")
+_JSON_ARRAY_FIELDS = ("interests", "brand_mentions", "detected_brands")
+
+
+# search_payload's generation expression needs this function to exist when
+# the table is created outside Alembic (init_db's create_all)
+event.listen(
+    Influencer.__table__,
+    "before_create",
+    DDL("""
+        CREATE OR REPLACE FUNCTION influencer_search_payload(
+            brands jsonb, themes jsonb, niche text, lang text
+        ) RETURNS jsonb
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT jsonb_build_object('brands', brands, 'themes', themes, 'niche', niche, 'lang', lang)
+        $$
+    """),
+)
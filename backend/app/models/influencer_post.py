@@ -1,13 +1,13 @@
 from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-import uuid
+from operator import attrgetter
 
-from app.core.database import Base
+from app.core.database import Base, TimestampMixin
+from app.core.uuid7 import uuid7
 
 
-class InfluencerPost(Base):
+class InfluencerPost(TimestampMixin, Base):
     """Scraped Instagram post content from Apify.
 
     Stores post captions, hashtags, and mentions for enhanced niche detection.
@@ -16,7 +16,7 @@ class InfluencerPost(Base):
 
     __tablename__ = "influencer_posts"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     influencer_id = Column(
         UUID(as_uuid=True),
         ForeignKey('influencers.id', ondelete='CASCADE'),
@@ -44,43 +44,53 @@ class InfluencerPost(Base):
 
     # Media
     thumbnail_url = Column(Text, nullable=True)
-    is_sponsored = Column(Boolean, default=False)
+    is_sponsored = Column(Boolean, default=False, nullable=False, server_default="false")
 
     # Apify metadata
     apify_scraped_at = Column(DateTime(timezone=True), nullable=True)
     apify_run_id = Column(String(100), nullable=True)
 
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
-
     # Relationship back to influencer
     influencer = relationship("Influencer", back_populates="posts")
 
     __table_args__ = (
         UniqueConstraint('influencer_id', 'instagram_post_id', name='uq_influencer_post'),
-        Index('idx_posts_influencer', 'influencer_id'),
+        Index('idx_posts_infl_time', 'influencer_id', posted_at.desc().nulls_last()),
         Index('idx_posts_posted_at', 'posted_at'),
-        Index('idx_posts_hashtags', 'hashtags', postgresql_using='gin'),
-        Index('idx_posts_mentions', 'mentions', postgresql_using='gin'),
+        Index('idx_posts_hashtags', 'hashtags', postgresql_using='gin', postgresql_ops={'hashtags': 'jsonb_path_ops'}),
+        Index('idx_posts_mentions', 'mentions', postgresql_using='gin', postgresql_ops={'mentions': 'jsonb_path_ops'}),
     )
 
     def to_dict(self) -> dict:
         """Convert to dictionary for API responses."""
-        return {
-            "id": str(self.id),
-            "influencer_id": str(self.influencer_id),
-            "instagram_post_id": self.instagram_post_id,
-            "shortcode": self.shortcode,
-            "post_url": self.post_url,
-            "caption": self.caption,
-            "hashtags": self.hashtags or [],
-            "mentions": self.mentions or [],
-            "post_type": self.post_type,
-            "posted_at": self.posted_at.isoformat() if self.posted_at else None,
-            "likes_count": self.likes_count,
-            "comments_count": self.comments_count,
-            "views_count": self.views_count,
-            "is_sponsored": self.is_sponsored,
-            "apify_scraped_at": self.apify_scraped_at.isoformat() if self.apify_scraped_at else None,
-        }
+        data = dict(zip(_TO_DICT_FIELDS, _to_dict_getter(self)))
+        data["id"] = str(self.id)
+        data["influencer_id"] = str(self.influencer_id)
+        data["hashtags"] = self.hashtags or []
+        data["mentions"] = self.mentions or []
+        if self.posted_at:
+            data["posted_at"] = self.posted_at.isoformat()
+        if self.apify_scraped_at:
+            data["apify_scraped_at"] = self.apify_scraped_at.isoformat()
+        return data
+
+
+# to_dict() keys, in response order
+_TO_DICT_FIELDS = (
+    "id",
+    "influencer_id",
+    "instagram_post_id",
+    "shortcode",
+    "post_url",
+    "caption",
+    "hashtags",
+    "mentions",
+    "post_type",
+    "posted_at",
+    "likes_count",
+    "comments_count",
+    "views_count",
+    "is_sponsored",
+    "apify_scraped_at",
+)
+_to_dict_getter = attrgetter(*_TO_DICT_FIELDS)
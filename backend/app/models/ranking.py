@@ -1,44 +1,51 @@
-from sqlalchemy import Column, String, Float, Boolean, DateTime, Text, CheckConstraint
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.sql import func
-import uuid
+from sqlalchemy import Column, String, Boolean, Text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import validates
 
-from app.core.database import Base
+from app.core.database import Base, TimestampMixin
+from app.core.uuid7 import uuid7
+from app.schemas.search import RankingWeights
 
 
-class RankingPreset(Base):
+# Balanced 8-factor weights, keyed like RankingWeights
+DEFAULT_PRESET_WEIGHTS = {
+    "credibility": 0.15,
+    "engagement": 0.20,
+    "audience_match": 0.15,
+    "growth": 0.10,
+    "geography": 0.10,
+    "brand_affinity": 0.10,
+    "creative_fit": 0.10,
+    "niche_match": 0.10,
+}
+
+
+class RankingPreset(TimestampMixin, Base):
     """Configurable ranking weight presets for 8-factor scoring."""
 
     __tablename__ = "ranking_presets"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     name = Column(String(100), nullable=False, unique=True)
     description = Column(Text, nullable=True)
 
-    # Weight configuration (8 factors)
-    credibility_weight = Column(Float, default=0.15)
-    engagement_weight = Column(Float, default=0.20)
-    audience_match_weight = Column(Float, default=0.15)
-    growth_weight = Column(Float, default=0.10)
-    geography_weight = Column(Float, default=0.10)
-    brand_affinity_weight = Column(Float, default=0.10)
-    creative_fit_weight = Column(Float, default=0.10)
-    niche_match_weight = Column(Float, default=0.10)
+    # Weight configuration: {"credibility": 0.15, "engagement": 0.20, ...}
+    # Keys and sum are checked by validate_weights; the database also enforces
+    # the sum (ranking_presets_weights_sum trigger, migration 019)
+    weights = Column(JSONB, nullable=False, default=lambda: dict(DEFAULT_PRESET_WEIGHTS))
 
     # Metadata
-    is_default = Column(Boolean, default=False)
-    is_system = Column(Boolean, default=False)  # System presets cannot be deleted
-
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
-
-    __table_args__ = (
-        CheckConstraint(
-            "credibility_weight + engagement_weight + audience_match_weight + growth_weight + "
-            "geography_weight + brand_affinity_weight + creative_fit_weight + niche_match_weight "
-            "BETWEEN 0.99 AND 1.01",
-            name="weights_sum_check"
-        ),
-    )
+    is_default = Column(Boolean, default=False, nullable=False, server_default="false")
+    is_system = Column(Boolean, default=False, nullable=False, server_default="false")  # System presets cannot be deleted
+
+    @validates("weights")
+    def validate_weights(self, key, weights):
+        """Reject factors RankingWeights doesn't know and weights not summing to 1."""
+        unknown = set(weights) - RankingWeights.model_fields.keys()
+        if unknown:
+            raise ValueError(f"unknown ranking factor(s) in weights: {', '.join(sorted(unknown))}")
+        total = sum(weights.values())
+        if not 0.99 <= total <= 1.01:
+            raise ValueError(f"ranking preset weights must sum to 1.0 (got {total})")
+        return weights
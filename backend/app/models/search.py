@@ -1,18 +1,18 @@
 from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-import uuid
+from sqlalchemy.sql import func, text
 
-from app.core.database import Base
+from app.core.database import Base, TimestampMixin
+from app.core.uuid7 import uuid7
 
 
-class Search(Base):
+class Search(TimestampMixin, Base):
     """Search history and saved searches."""
 
     __tablename__ = "searches"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Search input
     raw_query = Column(Text, nullable=False)
@@ -36,7 +36,7 @@ class Search(Base):
     result_count = Column(Integer, nullable=True)
 
     # Saved search metadata
-    is_saved = Column(Boolean, default=False)
+    is_saved = Column(Boolean, default=False, nullable=False, server_default="false")
     saved_name = Column(String(255), nullable=True)
     saved_description = Column(Text, nullable=True)
 
@@ -45,15 +45,15 @@ class Search(Base):
 
     # Timestamps
     executed_at = Column(DateTime(timezone=True), server_default=func.now())
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     results = relationship("SearchResult", back_populates="search", cascade="all, delete-orphan")
 
     __table_args__ = (
-        Index("idx_searches_saved", "is_saved"),
+        # Saved-search list: WHERE is_saved ORDER BY updated_at DESC (030)
+        Index("idx_searches_saved_recent", text("updated_at DESC"), postgresql_where=is_saved),
         Index("idx_searches_user", "user_identifier"),
+        # b-tree, not BRIN: history is read newest-first with LIMIT
         Index("idx_searches_executed", "executed_at"),
     )
 
@@ -63,7 +63,7 @@ class SearchResult(Base):
 
     __tablename__ = "search_results"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     search_id = Column(UUID(as_uuid=True), ForeignKey("searches.id", ondelete="CASCADE"), nullable=False)
     influencer_id = Column(UUID(as_uuid=True), ForeignKey("influencers.id", ondelete="CASCADE"), nullable=False)
 
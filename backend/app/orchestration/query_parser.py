@@ -1,11 +1,17 @@
-import json
+import hashlib
+import logging
 import re
-from openai import AsyncOpenAI
 from typing import Optional
 
+import orjson
+
 from app.config import get_settings
 from app.schemas.llm import ParsedSearchQuery, GenderFilter
 from app.core.exceptions import LLMParsingError
+from app.core.openai_client import get_openai_client
+from app.core.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
 
 
 SYSTEM_PROMPT = """You are a search query parser for an influencer discovery platform focused on the Spanish market.
@@ -493,6 +499,47 @@ _NICHE_DISCOVERY_FALLBACK: dict[str, list[str]] = {
 }
 
 
+# Parsed briefs, keyed by _parse_cache_key(). Re-running or re-opening the
+# same brief skips the LLM round trip entirely on a warm instance.
+PARSED_QUERY_CACHE_SIZE = 512
+PARSED_QUERY_CACHE_TTL_SECONDS = 24 * 3600
+_parsed_queries = TTLCache(maxsize=PARSED_QUERY_CACHE_SIZE, ttl=PARSED_QUERY_CACHE_TTL_SECONDS)
+
+# Changes whenever the prompt or output schema does, so edited prompts never
+# serve answers cached under the old ones
+_PROMPT_VERSION = hashlib.sha256(
+    SYSTEM_PROMPT.encode() + orjson.dumps(RESPONSE_FORMAT, option=orjson.OPT_SORT_KEYS)
+).hexdigest()[:16]
+
+# Identical on every call (see _PROMPT_VERSION); built once, never mutated.
+# It must stay the first message and free of per-request content: OpenAI
+# caches the prefill of a repeated prompt prefix (>= 1024 tokens), which
+# this ~4K-token prompt qualifies for.
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+
+def _cached_prompt_tokens(usage) -> Optional[int]:
+    """Prompt tokens served from OpenAI's prompt cache, if reported.
+
+    The pinned SDK predates prompt_tokens_details, so it arrives as an
+    untyped extra field (a dict).
+    """
+    details = getattr(usage, "prompt_tokens_details", None)
+    if isinstance(details, dict):
+        return details.get("cached_tokens")
+    return getattr(details, "cached_tokens", None)
+
+
+def _parse_cache_key(model: str, normalized_query: str) -> str:
+    """Content hash of what the LLM is asked: model, prompt version and query.
+
+    Whitespace runs are collapsed (briefs are often pasted from email with
+    stray line breaks); case is kept, since it can carry brand names.
+    """
+    text = " ".join(normalized_query.split())
+    return hashlib.sha256(f"{model}\0{_PROMPT_VERSION}\0{text}".encode()).hexdigest()
+
+
 def _normalize_spanish_numbers(text: str) -> str:
     """
     Normalize Spanish-format numbers (periods as thousands separators) to plain integers.
@@ -510,17 +557,22 @@ def _normalize_spanish_numbers(text: str) -> str:
 async def parse_search_query(query: str) -> ParsedSearchQuery:
     """Parse natural language query into structured search parameters using GPT-5.4."""
     settings = get_settings()
-    client = AsyncOpenAI(api_key=settings.openai_api_key)
 
     # Normalize Spanish number format before sending to LLM so follower ranges
     # like "100.000 y 300.000" are correctly interpreted as 100000 and 300000.
     normalized_query = _normalize_spanish_numbers(query)
 
+    cache_key = _parse_cache_key(settings.openai_model, normalized_query)
+    cached = _parsed_queries.get(cache_key)
+    if cached is not None:
+        # Callers adjust the parsed query in place, so hand out a copy
+        return cached.model_copy(deep=True)
+
     try:
-        completion = await client.chat.completions.create(
+        completion = await get_openai_client().chat.completions.create(
             model=settings.openai_model,
             messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
+                _SYSTEM_MESSAGE,
                 {"role": "user", "content": normalized_query}
             ],
             response_format=RESPONSE_FORMAT,
@@ -528,12 +580,18 @@ async def parse_search_query(query: str) -> ParsedSearchQuery:
             max_tokens=1000,
         )
 
+        if completion.usage:
+            logger.debug(
+                f"Query parse tokens: prompt={completion.usage.prompt_tokens} "
+                f"cached={_cached_prompt_tokens(completion.usage)}"
+            )
+
         response_text = completion.choices[0].message.content
         if not response_text:
             raise LLMParsingError("Empty response from LLM", query)
 
         # Parse the JSON response
-        parsed_data = json.loads(response_text)
+        parsed_data = orjson.loads(response_text)
 
         # --- Safety guards applied before building the Pydantic model ---
 
@@ -564,7 +622,7 @@ async def parse_search_query(query: str) -> ParsedSearchQuery:
         safe_exclude_niches = [n for n in safe_exclude_niches if n.lower() != raw_campaign_niche]
 
         # Convert to Pydantic model with validation
-        return ParsedSearchQuery(
+        parsed = ParsedSearchQuery(
             # Count and gender
             target_count=parsed_data.get("target_count", 5),
             influencer_gender=GenderFilter(parsed_data.get("influencer_gender", "any")),
@@ -628,20 +686,35 @@ async def parse_search_query(query: str) -> ParsedSearchQuery:
             reasoning=parsed_data.get("reasoning", ""),
         )
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise LLMParsingError(f"Failed to parse LLM response as JSON: {str(e)}", query)
     except Exception as e:
-        # Fallback to basic parsing if LLM fails
+        # Fallback to basic parsing if LLM fails (not cached - the next
+        # attempt should try the LLM again)
         return _fallback_parse(query, str(e))
 
+    _parsed_queries.set(cache_key, parsed)
+    return parsed.model_copy(deep=True)
+
+
+# _fallback_parse vocabulary, built once. The gender patterns match anywhere
+# in the text (like a substring test), female terms first since "female"
+# contains "male".
+_FEMALE_TERMS_RE = re.compile("female|woman|women|mujeres|mujer|femenino|chicas")
+_MALE_TERMS_RE = re.compile("male|man|men|hombres|hombre|masculino|chicos|varones")
+_FALLBACK_STOP_WORDS = frozenset(
+    {"find", "get", "show", "for", "the", "a", "an", "with", "and", "or", "influencers", "influencer"}
+)
+
 
 def _fallback_parse(query: str, error_reason: str) -> ParsedSearchQuery:
     """Fallback parsing when LLM fails - extract basic info from query."""
     query_lower = query.lower()
+    words = query.split()
 
     # Try to extract count
     target_count = 20
-    for word in query.split():
+    for word in words:
         if word.isdigit():
             count = int(word)
             if 1 <= count <= 50:
@@ -650,16 +723,13 @@ def _fallback_parse(query: str, error_reason: str) -> ParsedSearchQuery:
 
     # Try to extract gender (English + Spanish terms)
     influencer_gender = GenderFilter.ANY
-    _female_terms = {"female", "woman", "women", "mujeres", "mujer", "femenino", "chicas"}
-    _male_terms = {"male", "man", "men", "hombres", "hombre", "masculino", "chicos", "varones"}
-    if any(t in query_lower for t in _female_terms):
+    if _FEMALE_TERMS_RE.search(query_lower):
         influencer_gender = GenderFilter.FEMALE
-    elif any(t in query_lower for t in _male_terms):
+    elif _MALE_TERMS_RE.search(query_lower):
         influencer_gender = GenderFilter.MALE
 
     # Extract keywords (non-common words)
-    stop_words = {"find", "get", "show", "for", "the", "a", "an", "with", "and", "or", "influencers", "influencer"}
-    keywords = [word for word in query.split() if word.lower() not in stop_words and len(word) > 2]
+    keywords = [word for word in words if word.lower() not in _FALLBACK_STOP_WORDS and len(word) > 2]
 
     return ParsedSearchQuery(
         target_count=target_count,
@@ -124,6 +124,57 @@ class InfluencerData(BaseModel):
         from_attributes = True
 
 
+# The immutable InfluencerData defaults, so payloads built from cached rows
+# keep the full response shape (niche/warning fields rows don't fill).
+# List/dict defaults are left out: influencer_data_fields builds fresh ones
+# per call so payloads never share a mutable object.
+_INFLUENCER_DATA_DEFAULTS = {
+    key: value
+    for key, value in InfluencerData.model_construct(username="").model_dump().items()
+    if not isinstance(value, (list, dict))
+}
+
+
+def influencer_data_fields(influencer: Any) -> Dict[str, Any]:
+    """Map a cached Influencer row to InfluencerData's fields.
+
+    Accepts an Influencer instance or a Row of
+    cache_service.INFLUENCER_DATA_COLUMNS (same attribute names). NULL
+    columns get the API defaults (0, {} or []). The values come from typed
+    ORM columns, so the dict can go straight to orjson or to
+    InfluencerData.model_construct without re-validation.
+    """
+    return {
+        **_INFLUENCER_DATA_DEFAULTS,
+        "id": str(influencer.id),
+        "username": influencer.username,
+        "display_name": influencer.display_name,
+        "profile_picture_url": influencer.profile_picture_url,
+        "bio": influencer.bio,
+        "is_verified": influencer.is_verified or False,
+        "follower_count": influencer.follower_count or 0,
+        "credibility_score": influencer.credibility_score,
+        "engagement_rate": influencer.engagement_rate,
+        "follower_growth_rate_6m": influencer.follower_growth_rate_6m,
+        "avg_likes": influencer.avg_likes or 0,
+        "avg_comments": influencer.avg_comments or 0,
+        "avg_views": influencer.avg_views,
+        "audience_genders": influencer.audience_genders or {},
+        "audience_age_distribution": influencer.audience_age_distribution or {},
+        "audience_geography": influencer.audience_geography or {},
+        "interests": influencer.interests or [],
+        "brand_mentions": influencer.brand_mentions or [],
+        "detected_brands": [],
+        "platform_type": influencer.platform_type or "instagram",
+        "cached_at": influencer.cached_at,
+    }
+
+
+def influencer_to_data(influencer: Any) -> InfluencerData:
+    """Build InfluencerData from a cached Influencer row, skipping validation."""
+    return InfluencerData.model_construct(**influencer_data_fields(influencer))
+
+
 class RankedInfluencer(BaseModel):
     """Influencer with ranking information."""
     influencer_id: str
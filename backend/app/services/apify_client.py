@@ -291,7 +291,7 @@ class ApifyInstagramClient:
                 comments_count=item.get("commentsCount", 0) or 0,
                 views_count=item.get("videoViewCount") or item.get("viewsCount"),
                 thumbnail_url=item.get("displayUrl"),
-                is_sponsored=item.get("isSponsored", False) or item.get("isAdvertisement", False),
+                is_sponsored=bool(item.get("isSponsored") or item.get("isAdvertisement")),
                 owner_username=item.get("ownerUsername")
             )
         except Exception as e:
@@ -14,8 +14,8 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import select, func, literal, literal_column
+from sqlalchemy.dialects.postgresql import insert, JSONB
 
 from app.models.brand import Brand, normalize_brand_name
 from app.services.brand_scraper_service import ScrapedBrand, get_brand_scraper_service
@@ -139,69 +139,91 @@ class BrandImportService:
         )
         return stats
 
+    # Fields import_brand() only overwrites when the scraped value is set
+    MERGE_FIELDS = (
+        "description", "category", "subcategory", "industry",
+        "headquarters", "website", "instagram_handle", "brand_value_eur",
+    )
+
+    # Rows per INSERT statement (asyncpg allows at most 32767 bind params)
+    UPSERT_CHUNK_SIZE = 1000
+
     async def upsert_brands_bulk(self, brands: List[ScrapedBrand]) -> Dict[str, int]:
         """
         Bulk upsert brands using PostgreSQL ON CONFLICT.
-        More efficient for large imports.
-        
+
+        Same merge semantics as import_brand() - empty scraped fields never
+        overwrite stored ones and extra_data is merged - but one INSERT per
+        chunk instead of a SELECT + flush round trip per brand.
+
         Args:
             brands: List of ScrapedBrand objects
-        
+
         Returns:
-            Dict with counts
+            Dict with counts: {"created": n, "updated": n, "errors": n}
         """
+        stats = {"created": 0, "updated": 0, "errors": 0}
         if not brands:
-            return {"created": 0, "updated": 0, "errors": 0}
-        
-        # Prepare data for bulk insert
-        values = []
+            return stats
+
+        # Collapse duplicates first: ON CONFLICT can't touch a row twice in
+        # one statement. Later entries win field by field, as they would
+        # when imported one at a time.
+        merged: Dict[str, Dict[str, Any]] = {}
         for scraped in brands:
             normalized = normalize_brand_name(scraped.name)
-            values.append({
-                "name": scraped.name,
-                "name_normalized": normalized,
-                "description": scraped.description,
-                "category": scraped.category,
-                "subcategory": scraped.subcategory,
-                "industry": scraped.industry,
-                "headquarters": scraped.headquarters,
-                "website": scraped.website,
-                "instagram_handle": scraped.instagram_handle,
-                "source": scraped.source,
-                "source_rank": scraped.source_rank,
-                "brand_value_eur": scraped.brand_value_eur,
-                "extra_data": scraped.metadata or {},
-            })
-        
-        # PostgreSQL upsert with ON CONFLICT
-        stmt = insert(Brand).values(values)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["name_normalized"],
-            set_={
-                "description": stmt.excluded.description,
-                "category": stmt.excluded.category,
-                "subcategory": stmt.excluded.subcategory,
-                "industry": stmt.excluded.industry,
-                "headquarters": stmt.excluded.headquarters,
-                "website": stmt.excluded.website,
-                "instagram_handle": stmt.excluded.instagram_handle,
-                "source": stmt.excluded.source,
-                "source_rank": stmt.excluded.source_rank,
-                "brand_value_eur": stmt.excluded.brand_value_eur,
-                "extra_data": stmt.excluded.extra_data,
-                "updated_at": func.now(),
-            }
-        )
-        
+            row = merged.get(normalized)
+            if row is None:
+                merged[normalized] = {
+                    "name": scraped.name,
+                    "name_normalized": normalized,
+                    "source": scraped.source,
+                    "source_rank": scraped.source_rank,
+                    "extra_data": dict(scraped.metadata or {}),
+                    **{field: getattr(scraped, field) for field in self.MERGE_FIELDS},
+                }
+                continue
+            for field in self.MERGE_FIELDS:
+                value = getattr(scraped, field)
+                if value:
+                    row[field] = value
+            if scraped.metadata:
+                row["extra_data"].update(scraped.metadata)
+
+        values = list(merged.values())
         try:
-            await self.db.execute(stmt)
+            for i in range(0, len(values), self.UPSERT_CHUNK_SIZE):
+                stmt = insert(Brand).values(values[i:i + self.UPSERT_CHUNK_SIZE])
+                set_ = {
+                    field: func.coalesce(
+                        func.nullif(stmt.excluded[field], 0 if field == "brand_value_eur" else ""),
+                        Brand.__table__.c[field],
+                    )
+                    for field in self.MERGE_FIELDS
+                }
+                set_["extra_data"] = func.coalesce(
+                    Brand.__table__.c.extra_data, literal({}, JSONB)
+                ).op("||")(stmt.excluded.extra_data)
+                set_["updated_at"] = func.now()
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["name_normalized"],
+                    set_=set_,
+                ).returning(literal_column("xmax = 0").label("inserted"))
+
+                result = await self.db.execute(stmt)
+                for inserted in result.scalars():
+                    stats["created" if inserted else "updated"] += 1
             await self.db.commit()
-            logger.info(f"Bulk upserted {len(brands)} brands")
-            return {"processed": len(brands), "errors": 0}
         except Exception as e:
             logger.error(f"Bulk upsert failed: {e}")
             await self.db.rollback()
-            return {"processed": 0, "errors": len(brands)}
+            return {"created": 0, "updated": 0, "errors": len(values)}
+
+        logger.info(
+            f"Brand import complete: {stats['created']} created, "
+            f"{stats['updated']} updated, {stats['errors']} errors"
+        )
+        return stats
 
     async def get_brand_count(self) -> int:
         """Get total count of brands in database."""
@@ -300,8 +322,8 @@ class BrandImportService:
             brands = await scraper.collect_all_brands()
             logger.info(f"Collected {len(brands)} brands from scraper")
             
-            # Import to database
-            stats = await self.import_brands_batch(brands)
+            # Import to database in a few multi-row upserts
+            stats = await self.upsert_brands_bulk(brands)
             return stats
             
         finally:
@@ -10,9 +10,9 @@ import json
 import logging
 from typing import Optional, List
 from dataclasses import dataclass, field
-from openai import AsyncOpenAI
 
 from app.config import get_settings
+from app.core.openai_client import get_openai_client
 
 logger = logging.getLogger(__name__)
 
@@ -154,7 +154,11 @@ class BrandLookupService:
 
     def __init__(self):
         self.settings = get_settings()
-        self.client = AsyncOpenAI(api_key=self.settings.openai_api_key)
+
+    @property
+    def client(self):
+        """Shared AsyncOpenAI client (keeps its connections between requests)."""
+        return get_openai_client()
 
     async def lookup_brand(self, brand_name: str) -> Optional[BrandLookupResult]:
         """
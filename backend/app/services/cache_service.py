@@ -9,10 +9,73 @@ import logging
 
 from app.models.influencer import Influencer
 from app.config import get_settings
+from app.core.ttl_cache import TTLCache
 from app.services.brand_intelligence_service import get_brand_intelligence_service
 
 logger = logging.getLogger(__name__)
 
+# Profile fields a refresh only overwrites when PrimeTag returned a value
+# (upsert_influencer's `metrics.get(field) or existing.field`)
+BULK_KEEP_EXISTING_FIELDS = (
+    'display_name',
+    'profile_picture_url',
+    'bio',
+    'follower_count',
+    'avg_likes',
+    'avg_comments',
+    'avg_views',
+    'audience_genders',
+    'audience_age_distribution',
+    'audience_geography',
+    'interests',
+    'brand_mentions',
+    'country',
+)
+
+
+# Columns read by app.schemas.influencer.influencer_data_fields - selecting
+# just these (as a Row) skips ORM hydration for read-only API payloads
+INFLUENCER_DATA_COLUMNS = (
+    Influencer.id,
+    Influencer.username,
+    Influencer.display_name,
+    Influencer.profile_picture_url,
+    Influencer.bio,
+    Influencer.is_verified,
+    Influencer.follower_count,
+    Influencer.credibility_score,
+    Influencer.engagement_rate,
+    Influencer.follower_growth_rate_6m,
+    Influencer.avg_likes,
+    Influencer.avg_comments,
+    Influencer.avg_views,
+    Influencer.audience_genders,
+    Influencer.audience_age_distribution,
+    Influencer.audience_geography,
+    Influencer.interests,
+    Influencer.brand_mentions,
+    Influencer.platform_type,
+    Influencer.cached_at,
+)
+
+
+# In-process cache of INFLUENCER_DATA_COLUMNS rows for the single-influencer
+# GET endpoints, keyed ("id", id) / ("username", platform, username). Rows
+# are immutable, so they're safe to share across sessions; entries live for
+# settings.cache_ttl_seconds and are dropped when this process writes.
+INFLUENCER_ROW_CACHE_SIZE = 10_000
+_influencer_rows: Optional[TTLCache] = None
+
+
+def _row_cache() -> TTLCache:
+    global _influencer_rows
+    if _influencer_rows is None:
+        _influencer_rows = TTLCache(
+            maxsize=INFLUENCER_ROW_CACHE_SIZE,
+            ttl=get_settings().cache_ttl_seconds,
+        )
+    return _influencer_rows
+
 
 class CacheService:
     """Service for managing influencer data cache."""
@@ -45,7 +108,7 @@ class CacheService:
         # Build query conditions
         conditions = [
             Influencer.cache_expires_at > now,  # Not expired
-            Influencer.profile_active.isnot(False),  # Exclude invalidated handles
+            Influencer.profile_active == True,  # Exclude invalidated handles
         ]
 
         # Handle credibility filter - allow NULL for imported data without metrics
@@ -114,7 +177,7 @@ class CacheService:
         conditions = [
             Influencer.cache_expires_at > now,
             Influencer.interests.isnot(None),
-            Influencer.profile_active.isnot(False),  # Exclude invalidated handles
+            Influencer.profile_active == True,  # Exclude invalidated handles
         ]
         
         # Filter by country if specified
@@ -210,7 +273,7 @@ class CacheService:
         primary_conditions = [
             Influencer.cache_expires_at > now,
             Influencer.primary_niche.isnot(None),
-            Influencer.profile_active.isnot(False),  # Exclude invalidated handles
+            Influencer.profile_active == True,  # Exclude invalidated handles
         ]
 
         # Include exact match + related niches
@@ -254,7 +317,7 @@ class CacheService:
                 Influencer.cache_expires_at > now,
                 Influencer.primary_niche.is_(None),
                 Influencer.interests.isnot(None),
-                Influencer.profile_active.isnot(False),  # Exclude invalidated handles
+                Influencer.profile_active == True,  # Exclude invalidated handles
             ]
 
             if country:
@@ -344,7 +407,7 @@ class CacheService:
         
         conditions = [
             Influencer.cache_expires_at > now,
-            Influencer.profile_active.isnot(False),  # Exclude invalidated handles
+            Influencer.profile_active == True,  # Exclude invalidated handles
         ]
 
         # Build keyword search conditions
@@ -423,6 +486,43 @@ class CacheService:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_data_by_id(self, influencer_id: UUID) -> Optional[sa.Row]:
+        """Get the INFLUENCER_DATA_COLUMNS of a cached influencer by ID."""
+        key = ("id", influencer_id)
+        row = _row_cache().get(key)
+        if row is not None:
+            return row
+
+        query = select(*INFLUENCER_DATA_COLUMNS).where(Influencer.id == influencer_id)
+        result = await self.db.execute(query)
+        row = result.one_or_none()
+        if row is not None:
+            _row_cache().set(key, row)
+        return row
+
+    async def get_data_by_username(
+        self,
+        username: str,
+        platform_type: str = "instagram"
+    ) -> Optional[sa.Row]:
+        """Get the INFLUENCER_DATA_COLUMNS of a cached influencer by username."""
+        key = ("username", platform_type, username)
+        row = _row_cache().get(key)
+        if row is not None:
+            return row
+
+        query = select(*INFLUENCER_DATA_COLUMNS).where(
+            and_(
+                Influencer.username == username,
+                Influencer.platform_type == platform_type
+            )
+        )
+        result = await self.db.execute(query)
+        row = result.one_or_none()
+        if row is not None:
+            _row_cache().set(key, row)
+        return row
+
     async def get_by_ids(self, influencer_ids: List[UUID]) -> List[Influencer]:
         """Get multiple cached influencers by IDs."""
         query = select(Influencer).where(Influencer.id.in_(influencer_ids))
@@ -469,7 +569,7 @@ class CacheService:
             existing.display_name = metrics.get('display_name') or existing.display_name
             existing.profile_picture_url = metrics.get('profile_picture_url') or existing.profile_picture_url
             existing.bio = metrics.get('bio') or existing.bio
-            existing.is_verified = metrics.get('is_verified', existing.is_verified)
+            existing.is_verified = bool(metrics.get('is_verified', existing.is_verified))
             existing.follower_count = metrics.get('follower_count') or existing.follower_count
             existing.credibility_score = metrics.get('credibility_score')
             existing.engagement_rate = metrics.get('engagement_rate')
@@ -494,6 +594,8 @@ class CacheService:
             existing.updated_at = now
 
             await self.db.flush()
+            _row_cache().pop(("id", existing.id))
+            _row_cache().pop(("username", platform_type, username))
             return existing
 
         else:
@@ -506,7 +608,7 @@ class CacheService:
                 display_name=metrics.get('display_name'),
                 profile_picture_url=metrics.get('profile_picture_url'),
                 bio=metrics.get('bio'),
-                is_verified=metrics.get('is_verified', False),
+                is_verified=bool(metrics.get('is_verified')),
                 follower_count=metrics.get('follower_count'),
                 credibility_score=metrics.get('credibility_score'),
                 engagement_rate=metrics.get('engagement_rate'),
@@ -550,6 +652,8 @@ class CacheService:
             await self.db.delete(inf)
 
         await self.db.commit()
+        if expired:
+            _row_cache().clear()
         return len(expired)
 
     async def get_expiring_soon(
@@ -593,11 +697,17 @@ class CacheService:
     ) -> int:
         """
         Bulk upsert influencers using PostgreSQL ON CONFLICT.
-        More efficient than individual upserts for large batches.
+        More efficient than individual upserts for large batches: every row
+        goes out in one multi-row INSERT, i.e. a single round trip.
+
+        Existing rows are updated like upsert_influencer does: fields in
+        BULK_KEEP_EXISTING_FIELDS keep their cached value when the new one
+        is empty, the quality metrics are always overwritten.
         
         Args:
             influencers_data: List of dicts with influencer data
-                Each dict should have 'username' and 'metrics' keys
+                Each dict should have 'username' and 'metrics' keys, and
+                optionally 'primetag_encrypted_username'
             platform_type: Platform type for all influencers
             
         Returns:
@@ -609,8 +719,9 @@ class CacheService:
         now = datetime.utcnow()
         expires_at = now + self.cache_duration
         
-        # Prepare values for bulk insert
-        values = []
+        # Prepare values for bulk insert, keyed by username: ON CONFLICT can't
+        # touch the same row twice in one statement, so the last entry wins
+        values_by_username: Dict[str, Dict[str, Any]] = {}
         for data in influencers_data:
             username = data.get('username')
             metrics = data.get('metrics', {})
@@ -618,31 +729,26 @@ class CacheService:
             if not username:
                 continue
                 
-            values.append({
+            row = {
                 'platform_type': platform_type,
                 'username': username,
-                'display_name': metrics.get('display_name'),
-                'profile_picture_url': metrics.get('profile_picture_url'),
-                'bio': metrics.get('bio'),
-                'is_verified': metrics.get('is_verified', False),
-                'follower_count': metrics.get('follower_count'),
+                'primetag_encrypted_username': data.get('primetag_encrypted_username'),
+                'is_verified': bool(metrics.get('is_verified')),
                 'credibility_score': metrics.get('credibility_score'),
                 'engagement_rate': metrics.get('engagement_rate'),
                 'follower_growth_rate_6m': metrics.get('follower_growth_rate_6m'),
-                'avg_likes': metrics.get('avg_likes'),
-                'avg_comments': metrics.get('avg_comments'),
-                'avg_views': metrics.get('avg_views'),
-                'audience_genders': metrics.get('audience_genders'),
-                'audience_age_distribution': metrics.get('audience_age_distribution'),
-                'audience_geography': metrics.get('audience_geography'),
-                'interests': metrics.get('interests'),
-                'brand_mentions': metrics.get('brand_mentions'),
-                'country': metrics.get('country'),
                 'cached_at': now,
                 'cache_expires_at': expires_at,
                 'updated_at': now,
-            })
-        
+            }
+            # Empty values become SQL NULL so the conflict update keeps the
+            # cached one (a plain None would be stored as JSON 'null' in the
+            # JSONB columns, which COALESCE doesn't skip)
+            for field in BULK_KEEP_EXISTING_FIELDS:
+                row[field] = metrics.get(field) or sa.null()
+            values_by_username[username] = row
+        
+        values = list(values_by_username.values())
         if not values:
             return 0
         
@@ -651,27 +757,18 @@ class CacheService:
         
         # On conflict, update all fields except id and created_at
         update_dict = {
-            'display_name': stmt.excluded.display_name,
-            'profile_picture_url': stmt.excluded.profile_picture_url,
-            'bio': stmt.excluded.bio,
+            field: func.coalesce(stmt.excluded[field], getattr(Influencer, field))
+            for field in BULK_KEEP_EXISTING_FIELDS + ('primetag_encrypted_username',)
+        }
+        update_dict.update({
             'is_verified': stmt.excluded.is_verified,
-            'follower_count': stmt.excluded.follower_count,
             'credibility_score': stmt.excluded.credibility_score,
             'engagement_rate': stmt.excluded.engagement_rate,
             'follower_growth_rate_6m': stmt.excluded.follower_growth_rate_6m,
-            'avg_likes': stmt.excluded.avg_likes,
-            'avg_comments': stmt.excluded.avg_comments,
-            'avg_views': stmt.excluded.avg_views,
-            'audience_genders': stmt.excluded.audience_genders,
-            'audience_age_distribution': stmt.excluded.audience_age_distribution,
-            'audience_geography': stmt.excluded.audience_geography,
-            'interests': stmt.excluded.interests,
-            'brand_mentions': stmt.excluded.brand_mentions,
-            'country': stmt.excluded.country,
             'cached_at': stmt.excluded.cached_at,
             'cache_expires_at': stmt.excluded.cache_expires_at,
             'updated_at': stmt.excluded.updated_at,
-        }
+        })
         
         stmt = stmt.on_conflict_do_update(
             index_elements=['platform_type', 'username'],
@@ -680,6 +777,8 @@ class CacheService:
         
         await self.db.execute(stmt)
         await self.db.flush()
+        # Only usernames are known here, not the ids cached rows are keyed by
+        _row_cache().clear()
         
         return len(values)
 
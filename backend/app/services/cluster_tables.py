@@ -0,0 +1,42 @@
+"""cluster_tables.py — Physically reorder hot tables along their cluster index.
+
+Tables and their cluster keys (recorded by migration 018):
+  search_results — idx_search_results_rank (search_id, rank_position)
+
+Usage
+-----
+    cd backend && python -m app.services.cluster_tables
+
+CLUSTER holds an ACCESS EXCLUSIVE lock while it rewrites the table, so run
+it off-peak (e.g. nightly). For a lock-free rewrite use pg_repack instead:
+    pg_repack --table search_results --order-by "search_id, rank_position"
+
+Safe to re-run — CLUSTER just rewrites the table in index order again.
+"""
+import asyncio
+
+from sqlalchemy import text
+
+# Tables with a cluster index recorded via ALTER TABLE ... CLUSTER ON
+CLUSTERED_TABLES = ["search_results"]
+
+
+async def cluster_tables() -> None:
+    from app.core.database import get_engine
+    base_engine = get_engine()
+    engine = base_engine.execution_options(isolation_level="AUTOCOMMIT")
+
+    print("Clustering hot tables…")
+    async with engine.connect() as conn:
+        for table in CLUSTERED_TABLES:
+            await conn.execute(text(f"CLUSTER {table}"))
+            # Refresh planner stats (correlation changes after the rewrite)
+            await conn.execute(text(f"ANALYZE {table}"))
+            print(f"  {table}  reordered and analyzed")
+
+    await base_engine.dispose()
+    print("Done.")
+
+
+if __name__ == "__main__":
+    asyncio.run(cluster_tables())
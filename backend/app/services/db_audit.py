@@ -17,14 +17,11 @@ async def run_audit():
 
     settings = get_settings()
 
-    import ssl
     connect_args = {}
     from app.config import needs_ssl
+    from app.core.database import get_ssl_context
     if needs_ssl(settings.database_url_raw):
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-        connect_args["ssl"] = ctx
+        connect_args["ssl"] = get_ssl_context()
 
     engine = create_async_engine(settings.database_url, echo=False, connect_args=connect_args)
     async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
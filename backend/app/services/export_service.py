@@ -1,6 +1,7 @@
+import asyncio
 import csv
 import io
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
@@ -9,6 +10,7 @@ from sqlalchemy import select
 
 from app.models.search import Search, SearchResult
 from app.models.influencer import Influencer
+from app.core.database import get_session_maker
 from app.core.exceptions import ExportError
 
 
@@ -33,30 +35,47 @@ class ExportService:
         ("Profile URL", "profile_url"),  # Derived from username
     ]
 
+    # Rows fetched per server-side cursor round trip when streaming CSV
+    STREAM_BATCH_SIZE = 500
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def export_to_csv(self, search_id: UUID) -> str:
-        """Export search results to CSV format."""
-        results = await self._get_results_with_data(search_id)
+    async def has_results(self, search_id: UUID) -> bool:
+        """Check whether a search has any results to export."""
+        query = select(SearchResult.id).where(SearchResult.search_id == search_id).limit(1)
+        result = await self.db.execute(query)
+        return result.first() is not None
 
-        if not results:
-            raise ExportError(f"No results found for search {search_id}")
+    async def stream_csv(self, search_id: UUID) -> AsyncIterator[str]:
+        """Stream search results as CSV, one chunk per batch of rows.
 
+        Rows are read through a server-side cursor, so memory stays constant
+        regardless of result count. Uses its own session: the request-scoped
+        one is closed as soon as the route returns, before the body is sent.
+        """
         output = io.StringIO()
         writer = csv.writer(output)
 
         # Header row
         writer.writerow([col[0] for col in self.EXPORT_COLUMNS])
-
-        # Data rows
-        for result in results:
-            writer.writerow([
-                self._format_value(result, col[1])
-                for col in self.EXPORT_COLUMNS
-            ])
-
-        return output.getvalue()
+        yield output.getvalue()
+
+        session_maker = get_session_maker()
+        async with session_maker() as session:
+            result = await session.stream(
+                self._results_query(search_id).execution_options(yield_per=self.STREAM_BATCH_SIZE)
+            )
+            async for batch in result.partitions():
+                output.seek(0)
+                output.truncate()
+                for search_result, influencer in batch:
+                    row = self._result_row(search_result, influencer)
+                    writer.writerow([
+                        self._format_value(row, col[1])
+                        for col in self.EXPORT_COLUMNS
+                    ])
+                yield output.getvalue()
 
     async def export_to_excel(self, search_id: UUID) -> bytes:
         """Export search results to Excel format."""
@@ -66,6 +85,12 @@ class ExportService:
         if not results:
             raise ExportError(f"No results found for search {search_id}")
 
+        # openpyxl is pure-Python and CPU-bound: build the workbook off the
+        # event loop so other requests keep being served meanwhile
+        return await asyncio.to_thread(self._build_workbook, results, search)
+
+    def _build_workbook(self, results: List[dict], search: Optional[Search]) -> bytes:
+        """Render results as a styled .xlsx workbook."""
         wb = Workbook()
         ws = wb.active
         ws.title = "Influencer Results"
@@ -123,44 +148,46 @@ class ExportService:
         wb.save(output)
         return output.getvalue()
 
-    async def _get_results_with_data(self, search_id: UUID) -> List[dict]:
-        """Get search results with full influencer data."""
-        # Get search results with influencer data
-        query = (
+    def _results_query(self, search_id: UUID):
+        """Search results joined with influencer data, in rank order."""
+        return (
             select(SearchResult, Influencer)
             .join(Influencer, SearchResult.influencer_id == Influencer.id)
             .where(SearchResult.search_id == search_id)
             .order_by(SearchResult.rank_position)
         )
 
-        result = await self.db.execute(query)
-        rows = result.all()
-
-        results = []
-        for search_result, influencer in rows:
-            # Extract metrics
-            genders = influencer.audience_genders or {}
-            geography = influencer.audience_geography or {}
-
-            results.append({
-                'rank_position': search_result.rank_position,
-                'username': influencer.username,
-                'display_name': influencer.display_name,
-                'relevance_score': search_result.relevance_score,
-                'credibility_score': influencer.credibility_score,
-                'engagement_rate': (influencer.engagement_rate or 0) * 100,  # Convert to percentage
-                'spain_audience_pct': geography.get('ES', 0),
-                'growth_rate': (influencer.follower_growth_rate_6m or 0) * 100,  # Convert to percentage
-                'follower_count': influencer.follower_count,
-                'male_pct': genders.get('male', genders.get('Male', 0)),
-                'female_pct': genders.get('female', genders.get('Female', 0)),
-                'avg_likes': influencer.avg_likes,
-                'avg_comments': influencer.avg_comments,
-                'interests': ', '.join(influencer.interests or []),
-                'profile_url': f"https://instagram.com/{influencer.username}",  # Derived from username
-            })
-
-        return results
+    async def _get_results_with_data(self, search_id: UUID) -> List[dict]:
+        """Get search results with full influencer data."""
+        result = await self.db.execute(self._results_query(search_id))
+        return [
+            self._result_row(search_result, influencer)
+            for search_result, influencer in result.all()
+        ]
+
+    def _result_row(self, search_result: SearchResult, influencer: Influencer) -> dict:
+        """Flatten one search result and its influencer into export fields."""
+        # Extract metrics
+        genders = influencer.audience_genders or {}
+        geography = influencer.audience_geography or {}
+
+        return {
+            'rank_position': search_result.rank_position,
+            'username': influencer.username,
+            'display_name': influencer.display_name,
+            'relevance_score': search_result.relevance_score,
+            'credibility_score': influencer.credibility_score,
+            'engagement_rate': (influencer.engagement_rate or 0) * 100,  # Convert to percentage
+            'spain_audience_pct': geography.get('ES', 0),
+            'growth_rate': (influencer.follower_growth_rate_6m or 0) * 100,  # Convert to percentage
+            'follower_count': influencer.follower_count,
+            'male_pct': genders.get('male', genders.get('Male', 0)),
+            'female_pct': genders.get('female', genders.get('Female', 0)),
+            'avg_likes': influencer.avg_likes,
+            'avg_comments': influencer.avg_comments,
+            'interests': ', '.join(influencer.interests or []),
+            'profile_url': f"https://instagram.com/{influencer.username}",  # Derived from username
+        }
 
     async def _get_search(self, search_id: UUID) -> Optional[Search]:
         """Get search record."""
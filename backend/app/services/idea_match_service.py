@@ -23,12 +23,12 @@ import uuid
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
-from openai import AsyncOpenAI
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.core.database import get_session_maker
+from app.core.openai_client import get_openai_client
 from app.services.framework_selector import (
     FrameworkSelection,
     get_engagement_potential,
@@ -433,7 +433,11 @@ async def _retrieve_similar_campaigns(
 class IdeaMatchService:
     def __init__(self):
         self.settings = get_settings()
-        self.client = AsyncOpenAI(api_key=self.settings.openai_api_key)
+
+    @property
+    def client(self):
+        """Shared AsyncOpenAI client (keeps its connections between requests)."""
+        return get_openai_client()
 
     async def generate(
         self,
@@ -54,6 +54,10 @@ TAXONOMY_PATH = Path(__file__).resolve().parent.parent / "data" / "niche_taxonom
 # Number of influencers to send per individual LLM call (batched within the DB batch)
 LLM_CALL_SIZE = 10
 
+# LLM calls in flight at once within a DB batch; bounds the burst against the
+# tokens-per-minute quota while overlapping network latency
+LLM_CONCURRENCY = 5
+
 
 def load_valid_niches() -> set[str]:
     """Load valid niche keys from niche_taxonomy.yaml."""
@@ -157,6 +161,7 @@ class LLMNicheEnrichmentPipeline:
         settings = get_settings()
         self.openai = AsyncOpenAI(api_key=settings.openai_api_key, timeout=120.0)
         self.model = settings.openai_model
+        self._llm_slots = asyncio.Semaphore(LLM_CONCURRENCY)
 
         self.stats: Dict[str, Any] = {
             "total": 0,
@@ -291,6 +296,10 @@ class LLMNicheEnrichmentPipeline:
                 logger.error(f"LLM call failed: {e}")
             return []
 
+    async def _call_llm_bounded(self, influencer_subset: List[Dict]) -> List[Dict]:
+        async with self._llm_slots:
+            return await self.call_llm(influencer_subset)
+
     def _validate_and_coerce(self, result: Dict) -> Optional[Dict]:
         """
         Validate a single LLM result dict.
@@ -346,7 +355,8 @@ class LLMNicheEnrichmentPipeline:
     ) -> int:
         """
         Process one DB batch (up to batch_size influencers).
-        Splits into LLM sub-batches of LLM_CALL_SIZE each.
+        Splits into LLM sub-batches of LLM_CALL_SIZE each, sent concurrently
+        (at most LLM_CONCURRENCY at a time).
         Returns number of successfully enriched influencers.
         """
         logger.info(
@@ -361,10 +371,17 @@ class LLMNicheEnrichmentPipeline:
         # Collect all updates across sub-batches
         updates: List[Dict] = []
 
-        for i in range(0, len(influencers), LLM_CALL_SIZE):
-            sub_batch = influencers[i : i + LLM_CALL_SIZE]
-            results = await self.call_llm(sub_batch)
+        # call_llm never raises (failures come back as []), so one bad
+        # sub-batch can't cancel the others
+        sub_batches = [
+            influencers[i : i + LLM_CALL_SIZE]
+            for i in range(0, len(influencers), LLM_CALL_SIZE)
+        ]
+        all_results = await asyncio.gather(
+            *(self._call_llm_bounded(sub_batch) for sub_batch in sub_batches)
+        )
 
+        for results in all_results:
             for res in results:
                 validated = self._validate_and_coerce(res)
                 if not validated:
@@ -381,10 +398,6 @@ class LLMNicheEnrichmentPipeline:
 
                 updates.append({**validated, "id": inf_id})
 
-            # Pause between LLM calls to respect rate limits
-            if i + LLM_CALL_SIZE < len(influencers):
-                await asyncio.sleep(2)
-
         # Write this batch to DB
         success_count = await self.write_batch_to_db(updates)
         self.stats["success"] += success_count
@@ -422,6 +435,7 @@ class LLMNicheEnrichmentPipeline:
         logger.info(f"Model         : {self.model}")
         logger.info(f"Batch size    : {self.batch_size} influencers / DB write")
         logger.info(f"LLM call size : {LLM_CALL_SIZE} influencers / call")
+        logger.info(f"LLM parallel  : {LLM_CONCURRENCY} calls in flight")
         logger.info(f"Force mode    : {self.force}")
         logger.info(f"To enrich     : {len(influencers):,}")
 
@@ -16,6 +16,10 @@ logger = logging.getLogger(__name__)
 # Type variable for generic return types
 T = TypeVar('T')
 
+# Connection pool for the shared PrimeTag HTTP client (sized above
+# settings.cache_warm_concurrency so warm-cache fan-outs reuse sockets)
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
 # Country name to ISO 3166-1 alpha-2 code mapping
 # PrimeTag API returns country names (e.g., "Spain") instead of codes (e.g., "ES")
 COUNTRY_NAME_TO_ISO = {
@@ -203,6 +207,25 @@ class PrimeTagClient:
         }
         logger.info(f"PrimeTag client initialized with base URL: {self.base_url}")
 
+    def _http_client(self) -> httpx.AsyncClient:
+        """Keep-alive HTTP client shared by every call on this PrimeTagClient.
+
+        Reusing it keeps TLS sessions and sockets to PrimeTag open between
+        requests. httpx pools are bound to the event loop that created
+        them, so a new client is made if the running loop has changed.
+        """
+        loop = asyncio.get_running_loop()
+        if getattr(self, "_http", None) is None or self._http_loop is not loop:
+            self._http = httpx.AsyncClient(limits=HTTP_LIMITS)
+            self._http_loop = loop
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client's connections."""
+        if getattr(self, "_http", None) is not None:
+            await self._http.aclose()
+            self._http = None
+
     @staticmethod
     def extract_encrypted_username(mediakit_url: str) -> Optional[str]:
         """
@@ -246,42 +269,42 @@ class PrimeTagClient:
         url = f"{self.base_url}/media-kits"
         logger.info(f"PrimeTag search: GET {url} | params={params}")
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    url,
-                    params=params,
-                    headers=self.headers,
-                    timeout=30.0
+        client = self._http_client()
+        try:
+            response = await client.get(
+                url,
+                params=params,
+                headers=self.headers,
+                timeout=30.0
+            )
+
+            response_time_ms = int((time.time() - start_time) * 1000)
+            logger.info(f"PrimeTag search response: status={response.status_code} | time={response_time_ms}ms")
+
+            if response.status_code != 200:
+                logger.error(f"PrimeTag search failed: status={response.status_code} | body={response.text[:500]}")
+                retry_after = None
+                if response.status_code == 429:
+                    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                raise PrimeTagAPIError(
+                    f"Search failed with status {response.status_code}",
+                    response.text,
+                    status_code=response.status_code,
+                    retry_after=retry_after,
                 )
 
-                response_time_ms = int((time.time() - start_time) * 1000)
-                logger.info(f"PrimeTag search response: status={response.status_code} | time={response_time_ms}ms")
-
-                if response.status_code != 200:
-                    logger.error(f"PrimeTag search failed: status={response.status_code} | body={response.text[:500]}")
-                    retry_after = None
-                    if response.status_code == 429:
-                        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
-                    raise PrimeTagAPIError(
-                        f"Search failed with status {response.status_code}",
-                        response.text,
-                        status_code=response.status_code,
-                        retry_after=retry_after,
-                    )
+            data = response.json()
+            # Parse response
+            items = data.get("response", [])
+            logger.info(f"PrimeTag search success: found {len(items)} results for query='{search_query}'")
+            return [MediaKitSummary(**item) for item in items]
 
-                data = response.json()
-                # Parse response
-                items = data.get("response", [])
-                logger.info(f"PrimeTag search success: found {len(items)} results for query='{search_query}'")
-                return [MediaKitSummary(**item) for item in items]
-
-            except httpx.TimeoutException:
-                logger.error(f"PrimeTag search timeout after 30s: url={url}")
-                raise PrimeTagAPIError("Request timed out", None, is_timeout=True)
-            except httpx.RequestError as e:
-                logger.error(f"PrimeTag search request error: {type(e).__name__}: {str(e)}")
-                raise PrimeTagAPIError(f"Request failed: {str(e)}", None)
+        except httpx.TimeoutException:
+            logger.error(f"PrimeTag search timeout after 30s: url={url}")
+            raise PrimeTagAPIError("Request timed out", None, is_timeout=True)
+        except httpx.RequestError as e:
+            logger.error(f"PrimeTag search request error: {type(e).__name__}: {str(e)}")
+            raise PrimeTagAPIError(f"Request failed: {str(e)}", None)
 
     @with_retry(max_retries=3, base_delay=1.0, max_delay=30.0)
     async def get_media_kit_detail(
@@ -303,47 +326,47 @@ class PrimeTagClient:
         start_time = time.time()
         logger.info(f"PrimeTag detail: GET {url}")
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    url,
-                    headers=self.headers,
-                    timeout=30.0
+        client = self._http_client()
+        try:
+            response = await client.get(
+                url,
+                headers=self.headers,
+                timeout=30.0
+            )
+
+            response_time_ms = int((time.time() - start_time) * 1000)
+            logger.info(f"PrimeTag detail response: status={response.status_code} | time={response_time_ms}ms")
+
+            if response.status_code == 404:
+                logger.warning(f"PrimeTag media kit not found: {username_encrypted}")
+                raise PrimeTagAPIError(
+                    f"Media kit not found for {username_encrypted}",
+                    response.text,
+                    status_code=404  # 404 is NOT retryable
                 )
 
-                response_time_ms = int((time.time() - start_time) * 1000)
-                logger.info(f"PrimeTag detail response: status={response.status_code} | time={response_time_ms}ms")
-
-                if response.status_code == 404:
-                    logger.warning(f"PrimeTag media kit not found: {username_encrypted}")
-                    raise PrimeTagAPIError(
-                        f"Media kit not found for {username_encrypted}",
-                        response.text,
-                        status_code=404  # 404 is NOT retryable
-                    )
-
-                if response.status_code != 200:
-                    logger.error(f"PrimeTag detail failed: status={response.status_code} | body={response.text[:500]}")
-                    retry_after = None
-                    if response.status_code == 429:
-                        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
-                    raise PrimeTagAPIError(
-                        f"Detail fetch failed with status {response.status_code}",
-                        response.text,
-                        status_code=response.status_code,
-                        retry_after=retry_after,
-                    )
+            if response.status_code != 200:
+                logger.error(f"PrimeTag detail failed: status={response.status_code} | body={response.text[:500]}")
+                retry_after = None
+                if response.status_code == 429:
+                    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                raise PrimeTagAPIError(
+                    f"Detail fetch failed with status {response.status_code}",
+                    response.text,
+                    status_code=response.status_code,
+                    retry_after=retry_after,
+                )
 
-                data = response.json()
-                logger.info(f"PrimeTag detail success for: {username_encrypted}")
-                return MediaKit(**data.get("response", data))
+            data = response.json()
+            logger.info(f"PrimeTag detail success for: {username_encrypted}")
+            return MediaKit(**data.get("response", data))
 
-            except httpx.TimeoutException:
-                logger.error(f"PrimeTag detail timeout after 30s: url={url}")
-                raise PrimeTagAPIError("Request timed out", None, is_timeout=True)
-            except httpx.RequestError as e:
-                logger.error(f"PrimeTag detail request error: {type(e).__name__}: {str(e)}")
-                raise PrimeTagAPIError(f"Request failed: {str(e)}", None)
+        except httpx.TimeoutException:
+            logger.error(f"PrimeTag detail timeout after 30s: url={url}")
+            raise PrimeTagAPIError("Request timed out", None, is_timeout=True)
+        except httpx.RequestError as e:
+            logger.error(f"PrimeTag detail request error: {type(e).__name__}: {str(e)}")
+            raise PrimeTagAPIError(f"Request failed: {str(e)}", None)
 
     def extract_metrics(self, detail: MediaKit) -> Dict[str, Any]:
         """Extract required metrics from MediaKit detail response."""
@@ -442,33 +465,51 @@ class PrimeTagClient:
         Uses lighter retry settings since autocomplete should be fast.
         Returns empty list on permanent failures (non-retryable errors).
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/media-kit-auto-complete",
-                    params={"search": query},
-                    headers=self.headers,
-                    timeout=15.0
-                )
+        client = self._http_client()
+        try:
+            response = await client.get(
+                f"{self.base_url}/media-kit-auto-complete",
+                params={"search": query},
+                headers=self.headers,
+                timeout=15.0
+            )
+
+            if response.status_code != 200:
+                # For autocomplete, we return empty on client errors (4xx)
+                # but raise retryable error on server errors (5xx) or rate limits
+                if response.status_code == 429 or response.status_code >= 500:
+                    raise PrimeTagAPIError(
+                        f"Autocomplete failed with status {response.status_code}",
+                        response.text,
+                        status_code=response.status_code
+                    )
+                return []
 
-                if response.status_code != 200:
-                    # For autocomplete, we return empty on client errors (4xx)
-                    # but raise retryable error on server errors (5xx) or rate limits
-                    if response.status_code == 429 or response.status_code >= 500:
-                        raise PrimeTagAPIError(
-                            f"Autocomplete failed with status {response.status_code}",
-                            response.text,
-                            status_code=response.status_code
-                        )
-                    return []
+            data = response.json()
+            items = data.get("response", [])
+            return [MediaKitSummary(**item) for item in items]
+
+        except httpx.TimeoutException:
+            raise PrimeTagAPIError("Autocomplete timed out", None, is_timeout=True)
+        except PrimeTagAPIError:
+            raise  # Re-raise our own errors for retry logic
+        except Exception:
+            return []
 
-                data = response.json()
-                items = data.get("response", [])
-                return [MediaKitSummary(**item) for item in items]
 
-            except httpx.TimeoutException:
-                raise PrimeTagAPIError("Autocomplete timed out", None, is_timeout=True)
-            except PrimeTagAPIError:
-                raise  # Re-raise our own errors for retry logic
-            except Exception:
-                return []
+_client: Optional[PrimeTagClient] = None
+
+
+def get_primetag_client() -> PrimeTagClient:
+    """Process-wide PrimeTagClient (FastAPI dependency), so its HTTP
+    connection pool is reused across requests."""
+    global _client
+    if _client is None:
+        _client = PrimeTagClient()
+    return _client
+
+
+async def close_primetag_client() -> None:
+    """Close the process-wide client's connections (app shutdown)."""
+    if _client is not None:
+        await _client.aclose()
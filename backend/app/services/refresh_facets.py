@@ -0,0 +1,39 @@
+"""refresh_facets.py — Rebuild the mv_influencer_facets discovery rollup.
+
+The view (created by migration 021) holds influencer counts and median
+follower_count per primary_niche / influencer_tier / influencer_gender /
+content_language combination. It goes stale as influencers are imported,
+enriched or deactivated, so refresh it after those jobs (e.g. nightly,
+after validate_profiles).
+
+Usage
+-----
+    cd backend && python -m app.services.refresh_facets
+
+Uses REFRESH ... CONCURRENTLY, so reads of the view are never blocked.
+Safe to re-run.
+"""
+import asyncio
+
+from sqlalchemy import text
+
+FACETS_VIEW = "mv_influencer_facets"
+
+
+async def refresh_facets() -> None:
+    from app.core.database import get_engine
+    base_engine = get_engine()
+    engine = base_engine.execution_options(isolation_level="AUTOCOMMIT")
+
+    print(f"Refreshing {FACETS_VIEW}…")
+    async with engine.connect() as conn:
+        await conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {FACETS_VIEW}"))
+        rows = (await conn.execute(text(f"SELECT count(*) FROM {FACETS_VIEW}"))).scalar()
+        print(f"  {rows:,} facet rows")
+
+    await base_engine.dispose()
+    print("Done.")
+
+
+if __name__ == "__main__":
+    asyncio.run(refresh_facets())
@@ -6,7 +6,7 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.orchestration.query_parser import parse_search_query
-from app.services.primetag_client import PrimeTagClient
+from app.services.primetag_client import PrimeTagClient, get_primetag_client
 from app.services.filter_service import FilterService
 from app.services.ranking_service import RankingService
 from app.services.cache_service import CacheService
@@ -37,7 +37,7 @@ class SearchService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.primetag = PrimeTagClient()
+        self.primetag = get_primetag_client()
         self.filter_service = FilterService()
         self.ranking_service = RankingService()
         self.cache_service = CacheService(db)
@@ -392,23 +392,20 @@ async def audit_db(csv_path: str, freshness_hours: int = 48) -> dict:
       - Missing from DB: CSV usernames not found in the DB
       - Follower mismatches: spot-check CSV vs DB follower counts
     """
-    import ssl
 
     from sqlalchemy import select
     from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
     from sqlalchemy.orm import sessionmaker
 
     from app.config import get_settings, needs_ssl
+    from app.core.database import get_ssl_context
     from app.models.influencer import Influencer
 
     settings = get_settings()
 
     connect_args: dict = {}
     if needs_ssl(settings.database_url_raw):
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-        connect_args["ssl"] = ctx
+        connect_args["ssl"] = get_ssl_context()
 
     engine = create_async_engine(settings.database_url, echo=False, connect_args=connect_args)
     async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
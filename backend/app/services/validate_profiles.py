@@ -79,7 +79,7 @@ async def validate_profiles(dry_run: bool, delay: float, since_days: Optional[in
 
     async with async_session() as session:
         # Build query — only active profiles, optionally limited to unvalidated ones
-        stmt = select(Influencer).where(Influencer.profile_active.isnot(False))
+        stmt = select(Influencer).where(Influencer.profile_active == True)
 
         if since_days is not None:
             cutoff = datetime.now(timezone.utc) - timedelta(days=since_days)
@@ -0,0 +1,56 @@
+"""
+Unit tests for AllowAllCORSMiddleware (the Vercel CORS policy):
+
+  - Requests without an Origin header pass through untouched
+  - Simple requests get the origin echoed with credentials allowed
+  - Preflight requests are answered directly with method/header grants
+"""
+import httpx
+import pytest_asyncio
+from fastapi import FastAPI
+
+from app.core.middleware import AllowAllCORSMiddleware
+
+
+@pytest_asyncio.fixture
+async def client():
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    app.add_middleware(AllowAllCORSMiddleware)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+class TestAllowAllCORSMiddleware:
+
+    async def test_no_origin_passes_through(self, client):
+        response = await client.get("/ping")
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+
+    async def test_simple_request_echoes_origin(self, client):
+        response = await client.get("/ping", headers={"Origin": "https://app.example.com"})
+        assert response.status_code == 200
+        assert response.json() == {"ok": True}
+        assert response.headers["access-control-allow-origin"] == "https://app.example.com"
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert "Origin" in response.headers["vary"]
+
+    async def test_preflight_answered_without_routing(self, client):
+        response = await client.options(
+            "/ping",
+            headers={
+                "Origin": "https://app.example.com",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "content-type",
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "https://app.example.com"
+        assert "POST" in response.headers["access-control-allow-methods"]
+        assert response.headers["access-control-allow-headers"] == "content-type"
@@ -0,0 +1,96 @@
+"""
+Unit tests for the background init_db() handoff used by the local-dev lifespan:
+
+  - get_db waits for a pending init before opening a session
+  - A failed init surfaces from get_db instead of being swallowed
+  - A failed init is retried by the next get_db
+  - db_init_pending tracks the task
+"""
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core import database
+
+
+@pytest.fixture(autouse=True)
+def _reset_db_ready():
+    yield
+    database._db_ready = None
+
+
+def _session_maker():
+    session = MagicMock()
+    maker = MagicMock()
+    maker.return_value.__aenter__.return_value = session
+    return maker, session
+
+
+class TestDbReady:
+
+    async def test_get_db_waits_for_init(self):
+        order = []
+        release = asyncio.Event()
+
+        async def fake_init():
+            await release.wait()
+            order.append("init")
+
+        maker, session = _session_maker()
+        with patch.object(database, "init_db", fake_init), \
+                patch.object(database, "get_session_maker", return_value=maker):
+            database.start_init_db()
+            assert database.db_init_pending()
+
+            async def open_session():
+                async for db in database.get_db():
+                    order.append("session")
+                    assert db is session
+
+            request = asyncio.create_task(open_session())
+            await asyncio.sleep(0)
+            assert order == []
+            release.set()
+            await request
+
+        assert order == ["init", "session"]
+        assert not database.db_init_pending()
+
+    async def test_failed_init_surfaces(self):
+        async def fake_init():
+            raise RuntimeError("boom")
+
+        maker, _ = _session_maker()
+        with patch.object(database, "init_db", fake_init), \
+                patch.object(database, "get_session_maker", return_value=maker):
+            database.start_init_db()
+            with pytest.raises(RuntimeError, match="boom"):
+                async for _ in database.get_db():
+                    pass
+
+    async def test_failed_init_is_retried(self):
+        attempts = []
+
+        async def fake_init():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionRefusedError("db down")
+
+        maker, session = _session_maker()
+        with patch.object(database, "init_db", fake_init), \
+                patch.object(database, "get_session_maker", return_value=maker):
+            database.start_init_db()
+            with pytest.raises(ConnectionRefusedError):
+                async for _ in database.get_db():
+                    pass
+            assert isinstance(database.db_init_error(), ConnectionRefusedError)
+
+            async for db in database.get_db():
+                assert db is session
+
+        assert len(attempts) == 2
+        assert database.db_init_error() is None
+
+    def test_nothing_pending_by_default(self):
+        assert not database.db_init_pending()
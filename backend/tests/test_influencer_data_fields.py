@@ -0,0 +1,68 @@
+"""
+Unit tests for the cached-row -> InfluencerData mapping helpers:
+
+  - The payload carries every InfluencerData field
+  - NULL columns get the API defaults (0, False, {}, [], "instagram")
+  - Payloads never share mutable default lists/dicts
+  - influencer_to_data round-trips through InfluencerData validation
+  - A Row of INFLUENCER_DATA_COLUMNS carries every attribute the mapping reads
+"""
+import uuid
+from collections import namedtuple
+from datetime import datetime, timezone
+
+from app.models.influencer import Influencer
+from app.schemas.influencer import InfluencerData, influencer_data_fields, influencer_to_data
+from app.services.cache_service import INFLUENCER_DATA_COLUMNS
+
+
+def _row(**overrides) -> Influencer:
+    values = {"id": uuid.uuid4(), "username": "maria_padel", "platform_type": None}
+    values.update(overrides)
+    return Influencer(**values)
+
+
+class TestInfluencerDataFields:
+
+    def test_has_every_schema_field(self):
+        assert influencer_data_fields(_row()).keys() == InfluencerData.model_fields.keys()
+
+    def test_null_columns_get_defaults(self):
+        fields = influencer_data_fields(_row())
+        assert fields["follower_count"] == 0
+        assert fields["is_verified"] is False
+        assert fields["audience_geography"] == {}
+        assert fields["interests"] == []
+        assert fields["platform_type"] == "instagram"
+
+    def test_payloads_do_not_share_mutables(self):
+        first = influencer_data_fields(_row())
+        second = influencer_data_fields(_row())
+        for key, value in first.items():
+            if isinstance(value, (list, dict)):
+                assert value is not second[key], key
+        first["detected_brands"].append("nike")
+        assert influencer_to_data(_row()).detected_brands == []
+
+    def test_values_copied(self):
+        cached_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        row = _row(follower_count=120_000, interests=["padel"], cached_at=cached_at)
+        fields = influencer_data_fields(row)
+        assert fields["id"] == str(row.id)
+        assert fields["follower_count"] == 120_000
+        assert fields["interests"] == ["padel"]
+        assert fields["cached_at"] == cached_at
+
+    def test_to_data_is_valid(self):
+        data = influencer_to_data(_row(audience_genders={"female": 60.0}))
+        assert InfluencerData.model_validate(data.model_dump()) == data
+
+    def test_column_row_is_enough(self):
+        # Stand-in for the Row returned by select(*INFLUENCER_DATA_COLUMNS)
+        ColumnRow = namedtuple("ColumnRow", [c.key for c in INFLUENCER_DATA_COLUMNS])
+        row = ColumnRow(**{c.key: None for c in INFLUENCER_DATA_COLUMNS})._replace(
+            id=uuid.uuid4(), username="maria_padel", follower_count=5_000,
+        )
+        fields = influencer_data_fields(row)
+        assert fields["username"] == "maria_padel"
+        assert fields["follower_count"] == 5_000
@@ -0,0 +1,77 @@
+"""
+Unit tests for the parsed-query cache in parse_search_query:
+
+  - A repeated brief is served from the cache without calling the LLM
+  - Whitespace-only differences hit the same entry
+  - Cached results are copies, so callers can't mutate the cache
+  - LLM failures (fallback parses) are not cached
+"""
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.orchestration import query_parser
+from app.orchestration.query_parser import parse_search_query
+
+
+def _completion(payload: dict):
+    completion = MagicMock()
+    completion.choices = [MagicMock()]
+    completion.choices[0].message.content = json.dumps(payload)
+    return completion
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    query_parser._parsed_queries.clear()
+    yield
+    query_parser._parsed_queries.clear()
+
+
+@pytest.fixture
+def llm():
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(
+        return_value=_completion({"target_count": 7, "brand_name": "IKEA"})
+    )
+    # Stub settings so the tests don't need DATABASE_URL / API keys in the env
+    settings = SimpleNamespace(openai_model="test-model")
+    with patch.object(query_parser, "get_openai_client", return_value=client), \
+            patch.object(query_parser, "get_settings", return_value=settings):
+        yield client.chat.completions.create
+
+
+class TestParsedQueryCache:
+
+    async def test_repeat_query_skips_llm(self, llm):
+        first = await parse_search_query("7 influencers para IKEA")
+        second = await parse_search_query("7 influencers para IKEA")
+        assert llm.await_count == 1
+        assert second == first
+        assert second.target_count == 7
+
+    async def test_whitespace_variants_share_entry(self, llm):
+        await parse_search_query("7 influencers\npara IKEA ")
+        await parse_search_query("7 influencers para   IKEA")
+        assert llm.await_count == 1
+
+    async def test_different_query_misses(self, llm):
+        await parse_search_query("7 influencers para IKEA")
+        await parse_search_query("7 influencers para Nike")
+        assert llm.await_count == 2
+
+    async def test_cached_result_is_a_copy(self, llm):
+        first = await parse_search_query("7 influencers para IKEA")
+        first.campaign_topics.append("mutated")
+        second = await parse_search_query("7 influencers para IKEA")
+        assert "mutated" not in second.campaign_topics
+
+    async def test_fallback_not_cached(self, llm):
+        llm.side_effect = RuntimeError("rate limited")
+        await parse_search_query("7 influencers para IKEA")
+        llm.side_effect = None
+        parsed = await parse_search_query("7 influencers para IKEA")
+        assert llm.await_count == 2
+        assert parsed.brand_name == "IKEA"
@@ -0,0 +1,25 @@
+"""
+Unit tests for RankingPreset's weights validator:
+
+  - The default weights are accepted
+  - Keys RankingWeights doesn't know are rejected
+  - Weights that don't sum to 1.0 are rejected
+"""
+import pytest
+
+from app.models.ranking import DEFAULT_PRESET_WEIGHTS, RankingPreset
+
+
+class TestRankingPresetWeights:
+
+    def test_default_weights_accepted(self):
+        preset = RankingPreset(name="balanced", weights=dict(DEFAULT_PRESET_WEIGHTS))
+        assert preset.weights == DEFAULT_PRESET_WEIGHTS
+
+    def test_unknown_factor_rejected(self):
+        with pytest.raises(ValueError, match="credibilty"):
+            RankingPreset(name="typo", weights={"credibilty": 1.0})
+
+    def test_sum_must_be_one(self):
+        with pytest.raises(ValueError, match="sum to 1.0"):
+            RankingPreset(name="partial", weights={"engagement": 0.5, "niche_match": 0.2})
@@ -0,0 +1,48 @@
+"""
+Unit tests for the in-process TTLCache:
+
+  - Set values are returned until they expire
+  - Expired entries read as misses and are dropped
+  - The least recently used entry is evicted when full
+  - pop/clear invalidate entries
+"""
+from unittest.mock import patch
+
+from app.core.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+
+    def test_hit_and_miss(self):
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_expired_entry_is_a_miss(self):
+        cache = TTLCache(maxsize=4, ttl=60)
+        with patch("app.core.ttl_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("app.core.ttl_cache.time.monotonic", return_value=160.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_pop_and_clear(self):
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.pop("a")
+        cache.pop("missing")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
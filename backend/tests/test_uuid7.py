@@ -0,0 +1,34 @@
+"""
+Unit tests for the UUIDv7 primary-key generator:
+
+  - Version and variant bits follow RFC 9562
+  - The leading 48 bits are the current Unix time in milliseconds
+  - IDs from later milliseconds sort after earlier ones
+"""
+import time
+import uuid
+from unittest.mock import patch
+
+from app.core.uuid7 import uuid7
+
+
+class TestUuid7:
+
+    def test_version_and_variant(self):
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_embeds_current_millisecond(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after
+
+    def test_time_ordered(self):
+        ids = []
+        for ms in (1_000, 1_001, 2_000):
+            with patch("app.core.uuid7.time.time_ns", return_value=ms * 1_000_000):
+                ids.append(uuid7())
+        assert ids == sorted(ids)
+        assert len(set(uuid7() for _ in range(1000))) == 1000